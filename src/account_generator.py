@@ -188,17 +188,19 @@ class AccountGenerator:
             print(f"Error generating unique accounts: {str(e)}")
             raise
 
+    def iter_accounts(self, num_accounts):
+        """Lazily yield (username, password) pairs for the given number of accounts."""
+        for _ in range(num_accounts):
+            yield self.generate_username(), self.generate_password()
+
     def generate_accounts(self, num_accounts) -> list[dict]:
         """Generate specified number of accounts and save to CSV."""
         try:
-            accounts = []
             print(f"Generating {num_accounts} accounts...")
-            for _ in range(num_accounts):
-                account = {
-                    "username": self.generate_username(),
-                    "password": self.generate_password()
-                }
-                accounts.append(account)
+            accounts = [
+                {"username": username, "password": password}
+                for username, password in self.iter_accounts(num_accounts)
+            ]
             print(f"Generated {num_accounts} accounts")
             return accounts
         except Exception as e:
@@ -24,7 +24,7 @@ from PySide6.QtGui import (
 )
 
 # Import translation manager
-from .translation_manager import tr
+from .translation_manager import tr, trf
 
 # Import business logic
 from .models.account import Account, AccountStatus
@@ -610,7 +610,8 @@ class BatchCreatorMainWindow(QMainWindow):
         self.btn_pause.setEnabled(is_processing)
         self.btn_stop.setEnabled(is_processing)
         self.btn_export.setEnabled(has_accounts)
-        self.btn_manual_captcha.setEnabled(has_captcha_pending and is_processing)
+        # Pending captchas outlive the batch, so the check stays available after it ends
+        self.btn_manual_captcha.setEnabled(has_captcha_pending)
         
         # Update pause button text
         if self.viewmodel.is_paused:
@@ -671,9 +672,9 @@ class BatchCreatorMainWindow(QMainWindow):
             self.table_accounts.setItem(row, 3, QTableWidgetItem(account.notes))
     
     def log_message(self, message: str):
-        """Add a message to the log output"""
+        """Add a message, or a newline-separated block of messages, to the log output"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
+        formatted_message = "\n".join(f"[{timestamp}] {line}" for line in message.split("\n"))
         self.txt_log.append(formatted_message)
         
         # Auto-scroll to bottom
@@ -692,7 +693,7 @@ class BatchCreatorMainWindow(QMainWindow):
             success = self.viewmodel.import_accounts_from_csv(file_path)
             if success:
                 QMessageBox.information(self, tr("Success"), 
-                    tr("Imported %1 accounts successfully!").replace("%1", str(len(self.viewmodel.accounts))))
+                    trf("Imported %1 accounts successfully!", len(self.viewmodel.accounts)))
             else:
                 QMessageBox.critical(self, tr("Error"), 
                     tr("Failed to import CSV file. Check the log for details."))
@@ -709,7 +710,7 @@ class BatchCreatorMainWindow(QMainWindow):
             success = self.viewmodel.generate_random_accounts(count)
             if success:
                 QMessageBox.information(self, tr("Success"), 
-                    tr("Generated %1 accounts successfully!").replace("%1", str(count)))
+                    trf("Generated %1 accounts successfully!", count))
             else:
                 QMessageBox.critical(self, tr("Error"), 
                     tr("Failed to generate accounts. Check the log for details."))
@@ -741,7 +742,7 @@ class BatchCreatorMainWindow(QMainWindow):
             success = self.viewmodel.export_accounts_to_csv(file_path, include_results=True)
             if success:
                 QMessageBox.information(self, tr("Success"), 
-                    tr("Results exported successfully!\n\nFile: %1").replace("%1", os.path.basename(file_path)))
+                    trf("Results exported successfully!\n\nFile: %1", os.path.basename(file_path)))
             else:
                 QMessageBox.critical(self, tr("Error"), 
                     tr("Failed to export results. Check the log for details."))
@@ -771,7 +772,7 @@ class BatchCreatorMainWindow(QMainWindow):
     def on_batch_complete(self, success_count: int, failed_count: int):
         """Handle batch processing completion"""
         QMessageBox.information(self, tr("Processing Complete"), 
-            tr("Batch processing completed!\n\nSuccess: %1\nFailed: %2").replace("%1", str(success_count)).replace("%2", str(failed_count)))
+            trf("Batch processing completed!\n\nSuccess: %1\nFailed: %2", success_count, failed_count))
     
     def on_captcha_detected(self, account, message: str):
         """Handle captcha detection from ViewModel (MVVM View layer)"""
@@ -779,15 +780,15 @@ class BatchCreatorMainWindow(QMainWindow):
         self.update_accounts_display()
         
         # Show friendly captcha waiting prompt with multi-language support
-        friendly_message = tr("🔍 CAPTCHA detected for %1. Please complete the captcha in the browser.\n"
-                             "System will automatically check every 5 seconds.").replace("%1", account.username)
+        friendly_message = trf("🔍 CAPTCHA detected for %1. Please complete the captcha in the browser.\n"
+                               "System will automatically check every 5 seconds.", account.username)
         self.log_message.emit(friendly_message)
         
         # Optional: Show system tray notification if available
         if hasattr(self, 'tray_icon') and self.tray_icon:
             self.tray_icon.showMessage(
                 tr("Captcha Required"), 
-                tr("Please complete captcha for %1").replace("%1", account.username),
+                trf("Please complete captcha for %1", account.username),
                 QSystemTrayIcon.Information, 5000
             )
     
@@ -797,14 +798,14 @@ class BatchCreatorMainWindow(QMainWindow):
         self.update_accounts_display()
         
         # Show success message with multi-language support
-        success_message = tr("🎉 CAPTCHA completed for %1! Continuing registration...").replace("%1", account.username)
+        success_message = trf("🎉 CAPTCHA completed for %1! Continuing registration...", account.username)
         self.log_message.emit(success_message)
         
         # Optional: Show system tray notification if available
         if hasattr(self, 'tray_icon') and self.tray_icon:
             self.tray_icon.showMessage(
                 tr("Captcha Completed"), 
-                tr("Captcha completed for %1").replace("%1", account.username),
+                trf("Captcha completed for %1", account.username),
                 QSystemTrayIcon.Information, 3000
             )
     
@@ -814,14 +815,14 @@ class BatchCreatorMainWindow(QMainWindow):
         self.update_accounts_display()
         
         # Show timeout warning with multi-language support
-        timeout_message = tr("⏰ CAPTCHA timeout for %1 after 60 seconds. Account marked as failed.").replace("%1", account.username)
+        timeout_message = trf("⏰ CAPTCHA timeout for %1 after 60 seconds. Account marked as failed.", account.username)
         self.log_message.emit(timeout_message)
         
         # Optional: Show system tray notification if available
         if hasattr(self, 'tray_icon') and self.tray_icon:
             self.tray_icon.showMessage(
                 tr("Captcha Timeout"), 
-                tr("Captcha timeout for %1").replace("%1", account.username),
+                trf("Captcha timeout for %1", account.username),
                 QSystemTrayIcon.Warning, 5000
             )
     
@@ -54,6 +54,7 @@ class RichCLIConfig:
         self.headless: bool = False  # 新增无头模式选项
         self.output_dir: str = str(Path.cwd())
         self.batch_size: int = 5
+        self.max_concurrent: int = 3  # 同时注册的账号数
         self.timeout_seconds: int = 120
         self.max_retries: int = 3
 
@@ -245,6 +246,7 @@ class RichCLIHandler:
   └─ 备份策略: ✅ 启用文件锁保护
 
 ⚙️ 高级设置
+  ├─ 并发数量: {self.config.max_concurrent} 个账号同时注册
   ├─ 超时设置: {self.config.timeout_seconds}秒 验证码等待
   ├─ 重试次数: {self.config.max_retries}次 失败重试
   └─ 账号规格: 用户名2-14位，密码8-20位
@@ -475,9 +477,21 @@ class RichCLIHandler:
             await asyncio.sleep(0.1)  # 100ms 检查间隔，确保实时性
     
     async def _process_accounts(self, progress, overall_task, layout=None):
-        """处理账号注册逻辑"""
-        for i, account in enumerate(self.accounts):
-            self.current_account_index = i
+        """处理账号注册逻辑（最多 max_concurrent 个账号并发注册）"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        await asyncio.gather(*(
+            self._process_account(semaphore, account, progress, overall_task)
+            for account in self.accounts
+        ))
+        
+        # 强制保存剩余数据
+        if self.persistence_service:
+            self.persistence_service.force_save()
+    
+    async def _process_account(self, semaphore, account: Account, progress, overall_task):
+        """在并发槽位内注册单个账号"""
+        async with semaphore:
+            self.current_account_index += 1
             
             # 更新进度描述
             progress.update(
@@ -498,11 +512,6 @@ class RichCLIHandler:
                     else:
                         self.console.print(f"[red]❌ {account.username} 注册失败: {account.notes}[/red]")
                 
-            except KeyboardInterrupt:
-                self.add_log_message("用户中断操作", "WARNING")
-                if not self.config.verbose:
-                    self.console.print("\n[yellow]⚠️ 用户中断操作[/yellow]")
-                break
             except Exception as e:
                 account.mark_failed(f"注册异常: {str(e)}")
                 error_msg = f"账号 {account.username} 发生异常: {e}"
@@ -512,10 +521,6 @@ class RichCLIHandler:
             
             # 更新进度
             progress.update(overall_task, advance=1)
-        
-        # 强制保存剩余数据
-        if self.persistence_service:
-            self.persistence_service.force_save()
     
     def show_results(self):
         """显示最终结果"""
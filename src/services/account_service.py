@@ -79,19 +79,13 @@ class AccountService:
         if count <= 0:
             return []
         
-        generated_accounts = []
-        accounts_data = self.account_generator.generate_accounts(count)
-        
-        for i, acc_data in enumerate(accounts_data):
-            account = Account(
-                id=len(self._accounts) + i + 1,  # Generate unique ID
-                username=acc_data["username"],
-                password=acc_data["password"],
-                status=AccountStatus.QUEUED
-            )
-            generated_accounts.append(account)
-        
-        return generated_accounts
+        # Build accounts straight from the generated pairs, without an
+        # intermediate list of dicts
+        first_id = len(self._accounts) + 1
+        return [
+            Account(id=first_id + i, username=username, password=password, status=AccountStatus.QUEUED)
+            for i, (username, password) in enumerate(self.account_generator.iter_accounts(count))
+        ]
     
     # Account statistics and filtering
     def get_statistics(self) -> Dict[str, Any]:
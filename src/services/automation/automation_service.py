@@ -6,17 +6,32 @@ batch processing workflow. This service focuses purely on orchestration
 rather than implementation details.
 """
 
+import asyncio
 import logging
+from collections import deque
+from contextlib import suppress
+from functools import lru_cache
 from typing import Callable, Optional, Literal, Union
 from ...models.account import Account, AccountStatus
-from ...translation_manager import tr
+from ...translation_manager import tr, trf
+from ..callbacks import noop_callback
 from .base_backend import AutomationBackend
+from .event_loop import EventLoopThread
 from .playwright_backend import PlaywrightBackend
 from .selenium_backend import SeleniumBackend
 
 # Type alias for automation backend
 AutomationBackendType = Literal["playwright", "selenium"]
 
+# Seconds to wait for backend cleanup when shutting the service down
+CLEANUP_TIMEOUT = 10
+
+# Seconds between pause checks for concurrent batch workers
+PAUSE_POLL_INTERVAL = 0.5
+
+# Most recent errors kept in the error log; older entries are dropped
+ERROR_LOG_LIMIT = 500
+
 
 class BackendFactory:
     """Factory for creating automation backends"""
@@ -34,46 +49,46 @@ class BackendFactory:
     @staticmethod
     def get_available_backends() -> list[AutomationBackendType]:
         """Get list of available backends"""
-        available = []
-        
-        # Check Playwright (transitions framework) - preferred
-        try:
-            backend = PlaywrightBackend()
-            if backend.is_available():
-                available.append("playwright")
-        except Exception:
-            pass
-        
-        # Check Selenium
-        try:
-            backend = SeleniumBackend()
-            if backend.is_available():
-                available.append("selenium")
-        except Exception:
-            pass
-        
-        return available
+        return list(_detect_available_backends())
+
+
+@lru_cache(maxsize=None)
+def _detect_available_backends() -> tuple[AutomationBackendType, ...]:
+    """Probe the installed backends once; availability cannot change at runtime"""
+    available = []
+    
+    # Check Playwright (transitions framework) - preferred
+    with suppress(Exception):
+        if PlaywrightBackend().is_available():
+            available.append("playwright")
+    
+    # Check Selenium
+    with suppress(Exception):
+        if SeleniumBackend().is_available():
+            available.append("selenium")
+    
+    return tuple(available)
 
 
 class CallbackManager:
     """Manages callbacks for UI updates"""
     
     def __init__(self):
-        self.on_account_start: Optional[Callable[[Account], None]] = None
-        self.on_account_complete: Optional[Callable[[Account], None]] = None
-        self.on_batch_complete: Optional[Callable[[int, int], None]] = None
-        self.on_log_message: Optional[Callable[[str], None]] = None
+        self.on_account_start: Callable[[Account], None] = noop_callback
+        self.on_account_complete: Callable[[Account], None] = noop_callback
+        self.on_batch_complete: Callable[[int, int], None] = noop_callback
+        self.on_log_message: Callable[[str], None] = noop_callback
     
     def set_callbacks(self,
                      on_account_start: Callable[[Account], None] = None,
                      on_account_complete: Callable[[Account], None] = None,
                      on_batch_complete: Callable[[int, int], None] = None,
                      on_log_message: Callable[[str], None] = None):
-        """Set callback functions for UI updates"""
-        self.on_account_start = on_account_start
-        self.on_account_complete = on_account_complete
-        self.on_batch_complete = on_batch_complete
-        self.on_log_message = on_log_message
+        """Set callback functions for UI updates, using no-ops for missing ones"""
+        self.on_account_start = on_account_start or noop_callback
+        self.on_account_complete = on_account_complete or noop_callback
+        self.on_batch_complete = on_batch_complete or noop_callback
+        self.on_log_message = on_log_message or noop_callback
 
 
 class AutomationService:
@@ -95,15 +110,42 @@ class AutomationService:
         self.current_account_index = 0
         self.success_rate = 0.8  # For simulation mode
         
+        # Parallel registrations in run_batch; None uses the backend's limit
+        self.max_concurrent: Optional[int] = None
+        
+        # Bumped on every start and stop; workers of an older batch see the
+        # change and leave the accounts to the batch that replaced them
+        self._batch_generation = 0
+        self._batch_task: Optional[asyncio.Task] = None
+        
+        # Batch statistics, updated incrementally as accounts finish
+        self._success_count = 0
+        self._failed_count = 0
+        
+        # Progress snapshot shared with UI polling, updated in place
+        self._progress = {
+            'total': 0,
+            'completed': 0,
+            'progress_percent': 0,
+            'is_running': False,
+            'is_paused': False
+        }
+        
+        # Accounts currently handed to the backend, keyed by id()
+        self._in_flight_accounts: dict[int, Account] = {}
+        
         # Backend management - prefer state machine backend
         self._backend_type = backend_type
         self._backend: Optional[AutomationBackend] = None
         
+        # Event loop owning all backend coroutines (and the browsers they create)
+        self._loop_thread = EventLoopThread()
+        
         # Callback management
         self._callbacks = CallbackManager()
         
-        # Error tracking
-        self.error_log = []
+        # Error tracking, bounded so long sessions keep constant memory
+        self.error_log: deque[dict] = deque(maxlen=ERROR_LOG_LIMIT)
         
         # Initialize backend
         self._initialize_backend()
@@ -113,18 +155,17 @@ class AutomationService:
         try:
             self._backend = BackendFactory.create_backend(self._backend_type)
             self._backend.set_log_callback(self._log_message)
-            self._log_message(tr("Backend initialized: %1").replace("%1", self._backend_type))
+            self._log_message(trf("Backend initialized: %1", self._backend_type))
         except Exception as e:
             error_msg = f"Failed to initialize {self._backend_type} backend: {str(e)}"
             self.logger.error(error_msg)
-            self._log_message(tr("ERROR: %1").replace("%1", error_msg))
+            self._log_message(trf("ERROR: %1", error_msg))
             raise
     
     def _log_message(self, message: str):
         """Internal logging and callback"""
         self.logger.info(message)
-        if self._callbacks.on_log_message:
-            self._callbacks.on_log_message(message)
+        self._callbacks.on_log_message(message)
     
     # Backend management methods
     def get_backend_name(self) -> str:
@@ -139,10 +180,11 @@ class AutomationService:
         if backend_type == self._backend_type:
             return  # No change needed
         
-        # Cleanup old backend
+        # Cleanup old backend on the loop that owns its browser, waiting for it
+        # so no browser process outlives the switch
         if self._backend:
             try:
-                self._backend.cleanup()
+                self._loop_thread.run(self._backend.cleanup_async(), timeout=CLEANUP_TIMEOUT)
             except Exception as e:
                 self.logger.warning(f"Error cleaning up old backend: {e}")
         
@@ -150,7 +192,7 @@ class AutomationService:
         self._backend_type = backend_type
         self._initialize_backend()
         
-        self._log_message(tr("Backend switched to: %1").replace("%1", backend_type))
+        self._log_message(trf("Backend switched to: %1", backend_type))
     
     def get_available_backends(self) -> list[AutomationBackendType]:
         """Get list of available backends"""
@@ -158,7 +200,7 @@ class AutomationService:
     
     def is_backend_available(self, backend_type: AutomationBackendType) -> bool:
         """Check if a backend is available"""
-        return backend_type in self.get_available_backends()
+        return backend_type in _detect_available_backends()
     
     # Callback management
     def set_callbacks(self, 
@@ -178,35 +220,47 @@ class AutomationService:
         
         self.is_running = True
         self.is_paused = False
-        
-        # Determine starting point
-        all_queued = all(account.status == AccountStatus.QUEUED for account in accounts)
+        self._batch_generation += 1
+        
+        # Determine starting point in a single pass over the accounts
+        all_queued = True
+        first_queued = None
+        first_unfinished = None
+        for i, account in enumerate(accounts):
+            if account.status != AccountStatus.QUEUED:
+                all_queued = False
+            elif first_queued is None:
+                first_queued = i
+            if first_unfinished is None and account.status != AccountStatus.SUCCESS:
+                first_unfinished = i
         
         if all_queued:
             self.current_account_index = 0
-            self._log_message(tr("Started fresh batch processing for %1 accounts").replace("%1", str(len(accounts))))
+            self._log_message(trf("Started fresh batch processing for %1 accounts", len(accounts)))
         else:
-            # Resume from first queued account
-            self.current_account_index = 0
-            for i, account in enumerate(accounts):
-                if account.status == AccountStatus.QUEUED:
-                    self.current_account_index = i
-                    break
+            if first_queued is not None:
+                # Resume from first queued account
+                self.current_account_index = first_queued
+            elif first_unfinished is not None:
+                # No queued accounts, resume from first non-success
+                self.current_account_index = first_unfinished
+                account = accounts[first_unfinished]
+                if account.status in [AccountStatus.PROCESSING, AccountStatus.FAILED]:
+                    account.reset_status()
             else:
-                # No queued accounts, find first non-success
-                for i, account in enumerate(accounts):
-                    if account.status not in [AccountStatus.SUCCESS]:
-                        self.current_account_index = i
-                        if account.status in [AccountStatus.PROCESSING, AccountStatus.FAILED]:
-                            account.reset_status()
-                        break
-                else:
-                    # All successful
-                    self.is_running = False
-                    self._log_message(tr("All accounts already processed successfully"))
-                    return False
+                # All successful
+                self.is_running = False
+                self._log_message(tr("All accounts already processed successfully"))
+                return False
             
-            self._log_message(tr("Resuming batch processing from account %1").replace("%1", str(self.current_account_index + 1)))
+            self._log_message(trf("Resuming batch processing from account %1", self.current_account_index + 1))
+        
+        # Accounts before the starting point are not processed again, so their
+        # results seed the counters; the rest are counted as they finish
+        self._success_count = 0
+        self._failed_count = 0
+        for account in accounts[:self.current_account_index]:
+            self._count_result(account)
         
         return True
     
@@ -232,18 +286,17 @@ class AutomationService:
         self.is_running = False
         self.is_paused = False
         self.current_account_index = 0
+        self._batch_generation += 1
         
-        # Reset any processing accounts
-        for account in accounts:
+        # Reset accounts that were interrupted mid-registration
+        for account in list(self._in_flight_accounts.values()):
             if account.status == AccountStatus.PROCESSING:
                 account.reset_status()
         
-        # Cleanup backend resources
+        # Abort backend work on the backend's own loop without blocking the caller
         if self._backend:
-            try:
-                self._backend.cleanup()
-            except Exception as e:
-                self.logger.warning(f"Error during backend cleanup: {e}")
+            future = self._loop_thread.submit(self._backend.reset_async())
+            future.add_done_callback(self._log_background_error)
         
         self._log_message(tr("Processing stopped"))
         return True
@@ -257,31 +310,103 @@ class AutomationService:
             self._complete_batch_processing(accounts)
             return False
         
-        # Get current account
+        # Process current account through backend
         account = accounts[self.current_account_index]
+        self._loop_thread.run(self._process_account(account))
+        return True
+    
+    async def run_batch(self, accounts: list[Account]) -> bool:
+        """Register all remaining accounts concurrently, bounded by max_concurrent"""
+        if not self.start_batch_registration(accounts):
+            return False
         
+        await self._loop_thread.run_async(self._run_remaining(accounts, self._batch_generation))
+        return True
+    
+    def start_batch(self, accounts: list[Account]) -> bool:
+        """
+        Start a concurrent batch in the background without waiting for it
+        
+        Progress is reported only through the account/batch callbacks, which
+        fire on the automation event loop thread.
+        """
+        if not self.start_batch_registration(accounts):
+            return False
+        
+        future = self._loop_thread.submit(self._run_remaining(accounts, self._batch_generation))
+        future.add_done_callback(self._log_background_error)
+        return True
+    
+    def _is_current_batch(self, generation: int) -> bool:
+        """Whether the batch started as the given generation is still running"""
+        return self.is_running and generation == self._batch_generation
+    
+    async def _run_remaining(self, accounts: list[Account], generation: int):
+        """Run workers for the accounts from the starting point and finish the batch"""
+        # Workers of a stopped batch finish (aborted by the backend reset) before
+        # this batch touches the same accounts
+        previous, self._batch_task = self._batch_task, asyncio.current_task()
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        
+        await self._run_workers(accounts[self.current_account_index:], generation)
+        
+        if self._is_current_batch(generation):
+            self._complete_batch_processing(accounts)
+    
+    async def _run_workers(self, accounts: list[Account], generation: int):
+        """Run one worker per account, at most max_concurrent at a time"""
+        semaphore = asyncio.Semaphore(self.max_concurrent or self._backend.max_concurrency)
+        await asyncio.gather(*(self._worker(semaphore, account, generation) for account in accounts))
+    
+    async def _worker(self, semaphore: asyncio.Semaphore, account: Account, generation: int):
+        """Register one account of a concurrent batch once a slot is free"""
+        async with semaphore:
+            while self.is_paused and self._is_current_batch(generation):
+                await asyncio.sleep(PAUSE_POLL_INTERVAL)
+            if not self._is_current_batch(generation):
+                return
+            
+            if account.status in (AccountStatus.SUCCESS, AccountStatus.CAPTCHA_PENDING):
+                # Already processed in an earlier run: counted, but not registered again
+                self._count_result(account)
+            else:
+                await self._process_account(account)
+                if not self._is_current_batch(generation):
+                    return
+            self.current_account_index += 1
+    
+    async def _process_account(self, account: Account):
+        """Register one account through the backend with callbacks and statistics"""
         # Mark as processing and notify
         account.mark_processing()
         
-        if self._callbacks.on_account_start:
-            self._callbacks.on_account_start(account)
+        self._callbacks.on_account_start(account)
         
-        self._log_message(tr("Processing account: %1").replace("%1", account.username))
+        self._log_message(trf("Processing account: %1", account.username))
         
         # Process account through backend
+        generation = self._batch_generation
+        self._in_flight_accounts[id(account)] = account
         try:
-            import asyncio
-            success = asyncio.run(self._backend.register_account(account))
+            await self._backend.register_account(account)
         except Exception as e:
             self.logger.error(f"Backend registration error: {e}")
             account.mark_failed(f"Backend error: {str(e)}")
-            success = False
+        finally:
+            self._in_flight_accounts.pop(id(account), None)
         
-        # Notify completion
-        if self._callbacks.on_account_complete:
-            self._callbacks.on_account_complete(account)
+        if generation != self._batch_generation:
+            # Stopped mid-registration: a failure comes from the backend reset
+            # aborting it, so the account is queued again instead of counted
+            if account.status in (AccountStatus.PROCESSING, AccountStatus.FAILED):
+                account.reset_status()
+            return
         
-        return True
+        self._count_result(account)
+        
+        # Notify completion
+        self._callbacks.on_account_complete(account)
     
     def complete_current_account(self, accounts: list[Account]):
         """Complete processing of current account and move to next"""
@@ -293,37 +418,47 @@ class AutomationService:
         self.is_running = False
         self.is_paused = False
         
-        # Calculate statistics
-        success_count = len([acc for acc in accounts if acc.status == AccountStatus.SUCCESS])
-        failed_count = len([acc for acc in accounts if acc.status == AccountStatus.FAILED])
-        
         self._log_message(tr("Batch processing completed!"))
         
-        if self._callbacks.on_batch_complete:
-            self._callbacks.on_batch_complete(success_count, failed_count)
+        self._callbacks.on_batch_complete(self._success_count, self._failed_count)
+    
+    def _log_background_error(self, future):
+        """Log failures of work scheduled on the event loop without a waiting caller"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            self.logger.error(f"Error in background automation task: {error}")
+            self._log_message(trf("ERROR: %1", error))
+    
+    def _count_result(self, account: Account):
+        """Add a finished account to the batch statistics"""
+        if account.status == AccountStatus.SUCCESS:
+            self._success_count += 1
+        elif account.status == AccountStatus.FAILED:
+            self._failed_count += 1
     
     # Progress tracking
     def get_progress_info(self, accounts: list[Account]) -> dict:
-        """Get current progress information"""
+        """
+        Get current progress information
+        
+        Returns a dict shared between calls and updated in place; callers
+        must copy it if they want to keep a snapshot.
+        """
+        progress = self._progress
         total = len(accounts)
-        completed = self.current_account_index
-        
-        if total == 0:
-            return {
-                'total': 0,
-                'completed': 0,
-                'progress_percent': 0,
-                'is_running': self.is_running,
-                'is_paused': self.is_paused
-            }
-        
-        return {
-            'total': total,
-            'completed': completed,
-            'progress_percent': int(completed * 100 / total),
-            'is_running': self.is_running,
-            'is_paused': self.is_paused
-        }
+        completed = self.current_account_index if total else 0
+        
+        # Only recompute the percentage when the counts change
+        if progress['total'] != total or progress['completed'] != completed:
+            progress['total'] = total
+            progress['completed'] = completed
+            progress['progress_percent'] = int(completed * 100 / total) if total else 0
+        
+        progress['is_running'] = self.is_running
+        progress['is_paused'] = self.is_paused
+        return progress
     
     # Single account registration
     async def register_single_account(self, account: Account) -> bool:
@@ -334,13 +469,16 @@ class AutomationService:
         
         try:
             # Notify start of account processing
-            if self._callbacks.on_account_start:
-                self._callbacks.on_account_start(account)
+            self._callbacks.on_account_start(account)
             
             self._log_message(f"Starting registration for: {account.username}")
             
             # Register account through backend
-            success = await self._backend.register_account(account)
+            self._in_flight_accounts[id(account)] = account
+            try:
+                success = await self._loop_thread.run_async(self._backend.register_account(account))
+            finally:
+                self._in_flight_accounts.pop(id(account), None)
             
             # Log result
             if success:
@@ -349,8 +487,7 @@ class AutomationService:
                 self._log_message(f"Registration failed for: {account.username} - {account.notes}")
             
             # Notify completion
-            if self._callbacks.on_account_complete:
-                self._callbacks.on_account_complete(account)
+            self._callbacks.on_account_complete(account)
             
             return success
             
@@ -361,15 +498,14 @@ class AutomationService:
             self._log_message(f"Registration error for {account.username}: {error_msg}")
             
             # Notify completion even on error
-            if self._callbacks.on_account_complete:
-                self._callbacks.on_account_complete(account)
+            self._callbacks.on_account_complete(account)
             
             return False
     
     # Error management
     def get_error_log(self) -> list[dict]:
         """Get the error log for debugging"""
-        return self.error_log.copy()
+        return list(self.error_log)
     
     def clear_error_log(self):
         """Clear the error log"""
@@ -386,9 +522,11 @@ class AutomationService:
         """Cleanup service resources"""
         if self._backend:
             try:
-                self._backend.cleanup()
+                self._loop_thread.run(self._backend.cleanup_async(), timeout=CLEANUP_TIMEOUT)
             except Exception as e:
-                self.logger.warning(f"Error during service cleanup: {e}")
+                self.logger.error(f"Error during service cleanup: {e}")
+        
+        self._loop_thread.stop()
         
         self.is_running = False
         self.is_paused = False
\ No newline at end of file
@@ -7,23 +7,32 @@ Defines the common interface that all automation backends must implement.
 from abc import ABC, abstractmethod
 from typing import Callable, Optional
 from ...models.account import Account
+from ...translation_manager import trf
+from ..callbacks import noop_callback
 
 
 class AutomationBackend(ABC):
     """Abstract base class for automation backends"""
     
+    # Number of accounts the backend can register in parallel
+    max_concurrency = 1
+    
     def __init__(self):
         """Initialize the backend"""
-        self.on_log_message: Optional[Callable[[str], None]] = None
+        self.on_log_message: Callable[[str], None] = noop_callback
         
     def set_log_callback(self, callback: Optional[Callable[[str], None]]):
         """Set the logging callback function"""
-        self.on_log_message = callback
+        self.on_log_message = callback or noop_callback
         
     def _log(self, message: str):
         """Internal logging helper"""
-        if self.on_log_message:
-            self.on_log_message(message)
+        self.on_log_message(message)
+    
+    def _logf(self, text: str, *args):
+        """Log a translated %1..%9 template, skipping the formatting when nobody listens"""
+        if self.on_log_message is not noop_callback:
+            self.on_log_message(trf(text, *args))
     
     @abstractmethod
     async def register_account(self, account: Account) -> bool:
@@ -42,7 +51,15 @@ class AutomationBackend(ABC):
     def cleanup(self):
         """Clean up backend resources"""
         pass
-        
+
+    async def reset_async(self):
+        """Abort in-flight work while keeping reusable resources for the next run"""
+        await self.cleanup_async()
+
+    async def cleanup_async(self):
+        """Clean up backend resources from the event loop running the backend"""
+        self.cleanup()
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if this backend is available on the system"""
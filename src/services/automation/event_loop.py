@@ -0,0 +1,78 @@
+"""
+Dedicated event loop thread for automation backends
+
+Playwright objects are bound to the event loop that created them, so every
+coroutine touching a backend's browser (registration, cleanup) must run on the
+same loop. EventLoopThread owns one long-lived loop in a daemon thread and lets
+synchronous and asynchronous callers schedule work onto it.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+
+class EventLoopThread:
+    """Persistent asyncio event loop running in a background daemon thread"""
+
+    def __init__(self, name: str = "automation-loop"):
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the loop thread has been started and is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if needed and return its event loop"""
+        with self._lock:
+            if not self.is_running:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self._name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        """Check if the caller is running inside the loop thread"""
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop without waiting for it"""
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it completes"""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("Cannot block on the automation event loop from inside it")
+        return self.submit(coro).result(timeout)
+
+    async def run_async(self, coro: Coroutine) -> Any:
+        """Await a coroutine on the loop from any other event loop"""
+        if self.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the loop and wait for the thread to exit"""
+        with self._lock:
+            if not self.is_running:
+                return
+            loop, thread = self._loop, self._thread
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if thread.is_alive():
+                self.logger.warning(f"Event loop thread {self._name} did not stop within {timeout}s")
+                return
+            loop.close()
+            self._loop = None
+            self._thread = None
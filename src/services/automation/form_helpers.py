@@ -5,16 +5,206 @@ Provides common utilities for finding elements, filling forms, and handling inte
 that are shared across different automation backends.
 """
 
-from typing import List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Sequence
 import asyncio
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from ...models.account import Account
 from ...exceptions import ElementNotFoundError, FormInteractionError
 
+# Playwright selector engines that cannot be part of a CSS selector list
+_ENGINE_PREFIXES = ('xpath=', 'text=')
+
+# Precomputed selector union: (joined CSS selector list, engine-prefixed selectors)
+SelectorUnion = Tuple[str, Tuple[str, ...]]
+
+
+def join_selectors(selectors: Sequence[str]) -> SelectorUnion:
+    """
+    Join fallback selectors into a single Playwright selector union
+    
+    CSS selectors are comma-joined into one selector list; selectors using another
+    engine (xpath=, text=) cannot be comma-joined and are kept apart so they can be
+    chained with Locator.or_() into the same locator.
+    """
+    css = [s for s in selectors if not s.startswith(_ENGINE_PREFIXES)]
+    others = tuple(s for s in selectors if s.startswith(_ENGINE_PREFIXES))
+    return ", ".join(css), others
+
+
+def union_locator(page: Any, selector_union: SelectorUnion) -> Any:
+    """
+    Build a locator for the first visible element matching a selector union
+    
+    The whole union is resolved by the browser in a single round-trip, and the
+    visibility filter runs browser-side instead of per element from Python.
+    Matches come in DOM order, not selector order, so use it to wait for any
+    entry and SelectorCache.locate to pick the highest-priority one.
+    """
+    css, others = selector_union
+    selectors = ([css] if css else []) + list(others)
+    locator = page.locator(selectors[0])
+    for selector in selectors[1:]:
+        locator = locator.or_(page.locator(selector))
+    return locator.locator('visible=true').first
+
+
+# For each entry of a selector list, whether it has a visible match: true, false,
+# or null for entries only Playwright can resolve (text=, :has-text() and the like)
+_VISIBLE_MATCHES_JS = """selectors => {
+    const visible = e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden';
+    return selectors.map(s => {
+        try {
+            if (s.startsWith('xpath=')) {
+                const r = document.evaluate(s.slice(6), document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < r.snapshotLength; i++) {
+                    if (visible(r.snapshotItem(i))) return true;
+                }
+                return false;
+            }
+            if (s.startsWith('text=')) return null;
+            return [...document.querySelectorAll(s)].some(visible);
+        } catch (e) {
+            return null;
+        }
+    });
+}"""
+
+
+class SelectorCache:
+    """
+    Remembers which entry of a fallback selector list matched on the live site
+    
+    The full union is waited on, then the first entry of the list with a visible
+    match wins, so list order keeps deciding between specific and broad fallbacks.
+    Once a winner is learned, later pages wait on that single selector instead of
+    the whole union. If the winner stops matching (site update) it is forgotten and
+    the full union is tried again for a short grace period, then re-learned.
+    """
+    
+    # Milliseconds given to the full union after a learned winner times out
+    RELEARN_TIMEOUT = 2000
+    
+    def __init__(self):
+        self._unions: Dict[Tuple[str, ...], SelectorUnion] = {}
+        self._winners: Dict[Tuple[str, ...], str] = {}
+    
+    def _union(self, selectors: Tuple[str, ...]) -> SelectorUnion:
+        """Get the precomputed union for a selector list"""
+        union = self._unions.get(selectors)
+        if union is None:
+            union = self._unions[selectors] = join_selectors(selectors)
+        return union
+    
+    async def locate(self, page: Any, selectors: Tuple[str, ...], timeout: float) -> Any:
+        """
+        Wait for the first visible element of a fallback list
+        
+        Raises PlaywrightTimeoutError if no selector matches in time.
+        """
+        winner = self._winners.get(selectors)
+        if winner:
+            locator = union_locator(page, join_selectors((winner,)))
+            try:
+                await locator.wait_for(state='visible', timeout=timeout)
+                return locator
+            except PlaywrightTimeoutError:
+                self._winners.pop(selectors, None)
+                timeout = self.RELEARN_TIMEOUT
+        
+        locator = union_locator(page, self._union(selectors))
+        await locator.wait_for(state='visible', timeout=timeout)
+        
+        # The union matched in DOM order; take the first entry in list order instead,
+        # asking Playwright only about entries the page script cannot evaluate
+        matches = await page.evaluate(_VISIBLE_MATCHES_JS, list(selectors))
+        for selector, visible in zip(selectors, matches):
+            if visible is None:
+                visible = await page.locator(selector).locator('visible=true').count() > 0
+            if visible:
+                self._winners[selectors] = selector
+                return union_locator(page, join_selectors((selector,)))
+        # Gone again since the wait; keep the union's match
+        return locator
+
+
+# Shared by all registrations: every page targets the same site
+selector_cache = SelectorCache()
+
+
+# Fills every field and ticks the checkbox in one page evaluation. Each field takes
+# the first visible element of its fallback list not already claimed by an earlier
+# field; values go through the native setter followed by input/change/blur so the
+# page's own validation runs. Returns the values read back (null if not found).
+FILL_FORM_JS = """([fields, checkboxes]) => {
+    const claimed = new Set();
+    const find = selectors => {
+        for (const s of selectors) {
+            let el = null;
+            try {
+                el = [...document.querySelectorAll(s)].find(
+                    e => e.getClientRects().length > 0 && !claimed.has(e));
+            } catch (e) {
+                continue;
+            }
+            if (el) {
+                claimed.add(el);
+                return el;
+            }
+        }
+        return null;
+    };
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const values = fields.map(([selectors, value]) => {
+        const el = find(selectors);
+        if (!el) return null;
+        el.focus();
+        setValue.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+        return el.value;
+    });
+    const box = find(checkboxes);
+    if (box && !box.checked) box.click();
+    return {values, checked: !!(box && box.checked)};
+}"""
+
+
+def _css_only(selectors: Sequence[str]) -> List[str]:
+    """Drop engine-prefixed entries that querySelectorAll cannot evaluate"""
+    return [s for s in selectors if not s.startswith(_ENGINE_PREFIXES)]
+
+
+async def fill_form(page: Any, fields: Sequence[Tuple[Sequence[str], str]],
+                    checkboxes: Sequence[str]) -> Tuple[List[Any], bool]:
+    """
+    Fill several inputs and tick a checkbox in a single round-trip
+    
+    Args:
+        page: Playwright page
+        fields: (fallback selectors, value) pairs, filled in order
+        checkboxes: Fallback selectors for the checkbox to tick
+        
+    Returns:
+        (values read back per field, None where no field was found; whether the
+        checkbox ended up checked)
+    """
+    result = await page.evaluate(
+        FILL_FORM_JS,
+        [[[_css_only(selectors), value] for selectors, value in fields], _css_only(checkboxes)]
+    )
+    return result['values'], result['checked']
+
 
 class FormSelectors:
     """Common form selectors for 360.cn registration"""
     
-    REGISTRATION_BUTTONS = [
+    # The sign-up popup 360's QUC widget appends to <body>; entries scoped to it
+    # replace the absolute /html/body/div[9]/... paths and cannot match the
+    # homepage login form
+    REGISTRATION_MODAL_FORM = '.quc-mod-sign-up form'
+    
+    REGISTRATION_BUTTONS = (
         '.quc-link-sign-up',  # 360.cn 实际使用的注册按钮类名
         '.wan-register-btn',
         'text="免费注册"',
@@ -22,11 +212,11 @@ class FormSelectors:
         'a[data-bk="wan-public-reg"]',
         'text="立即注册"',
         'a[href*="register"]',
-        'xpath=/html/body/div/div/div[2]/div/div/div/div[2]/form/div[6]/div[2]/a[1]'
-    ]
+        '.quc-mod-sign-in form a.quc-link-sign-up'
+    )
     
-    REGISTRATION_FORMS = [
-        'xpath=/html/body/div[9]/div[2]/div/div/div/form',
+    REGISTRATION_FORMS = (
+        REGISTRATION_MODAL_FORM,
         '.modal form',
         '.popup form', 
         '.register-form',
@@ -34,10 +224,10 @@ class FormSelectors:
         'form input[name="username"]',
         'form input[placeholder*="用户名"]',
         'form input[placeholder*="账号"]'
-    ]
+    )
     
-    USERNAME_FIELDS = [
-        'xpath=/html/body/div[9]/div[2]/div/div/div/form/div[1]/div/div[1]/div/div/input',
+    USERNAME_FIELDS = (
+        REGISTRATION_MODAL_FORM + ' input[name="username"]',
         'input[name="username"]',
         'input[placeholder*="用户名"]',
         'input[placeholder*="账号"]',
@@ -46,10 +236,10 @@ class FormSelectors:
         '#username',
         '.username',
         'form input[type="text"]'
-    ]
+    )
     
-    PASSWORD_FIELDS = [
-        'xpath=/html/body/div[9]/div[2]/div/div/div/form/div[1]/div/div[2]/div/div/input',
+    PASSWORD_FIELDS = (
+        REGISTRATION_MODAL_FORM + ' input[name="password"]',
         'input[name="password"]',
         'input[placeholder*="密码"]',
         'input[placeholder*="Password"]',
@@ -57,34 +247,44 @@ class FormSelectors:
         '#password',
         '.password',
         'form input[type="password"]'
-    ]
+    )
     
-    CONFIRM_PASSWORD_FIELDS = [
-        'xpath=/html/body/div[9]/div[2]/div/div/div/form/div[1]/div/div[3]/div/div/input',
+    CONFIRM_PASSWORD_FIELDS = (
+        REGISTRATION_MODAL_FORM + ' input[name="password2"]',
+        'input[name="password2"]',
         'input[name="confirm_password"]',
         'input[name="password_confirm"]',
         'input[placeholder*="再次输入"]',
         'input[placeholder*="确认密码"]',
         'form input[type="password"]:last-of-type'
-    ]
+    )
     
-    TERMS_CHECKBOXES = [
-        'xpath=/html/body/div[9]/div[2]/div/div/div/form/div[2]/label/input',
+    TERMS_CHECKBOXES = (
+        REGISTRATION_MODAL_FORM + ' label input[type="checkbox"]',
         'input[type="checkbox"]',
         '.terms input[type="checkbox"]',
         '.agreement input[type="checkbox"]',
         'label input[type="checkbox"]'
-    ]
+    )
     
-    SUBMIT_BUTTONS = [
-        'xpath=/html/body/div[9]/div[2]/div/div/div/form/div[3]/input',
+    SUBMIT_BUTTONS = (
+        REGISTRATION_MODAL_FORM + ' input[type="submit"]',
         'input[type="submit"]',
         'button[type="submit"]',
         '.submit-btn',
         '.confirm-btn',
         'input[value*="注册"]',
-        'button:contains("注册")'
-    ]
+        'button:has-text("注册")'
+    )
+    
+    # Single-locator unions of the fallback lists above
+    REGISTRATION_BUTTONS_UNION = join_selectors(REGISTRATION_BUTTONS)
+    REGISTRATION_FORMS_UNION = join_selectors(REGISTRATION_FORMS)
+    USERNAME_FIELDS_UNION = join_selectors(USERNAME_FIELDS)
+    PASSWORD_FIELDS_UNION = join_selectors(PASSWORD_FIELDS)
+    CONFIRM_PASSWORD_FIELDS_UNION = join_selectors(CONFIRM_PASSWORD_FIELDS)
+    TERMS_CHECKBOXES_UNION = join_selectors(TERMS_CHECKBOXES)
+    SUBMIT_BUTTONS_UNION = join_selectors(SUBMIT_BUTTONS)
 
 
 class RetryHelper:
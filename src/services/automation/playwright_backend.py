@@ -5,6 +5,7 @@ Playwright Backend Implementation
 
 import asyncio
 import logging
+import re
 from typing import Optional
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, PlaywrightContextManager, ViewportSize
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
@@ -15,10 +16,58 @@ from ...models.account import Account, AccountStatus
 from ...translation_manager import tr
 from ...exceptions import BrowserInitializationError
 
+# Chromium launch arguments (anti-detection and background throttling tweaks)
+_CHROMIUM_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-ipc-flooding-protection',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-sync',
+    '--force-color-profile=srgb',
+    '--metrics-recording-only',
+    '--use-mock-keychain',
+    '--disable-background-networking',
+)
+
+# Default Playwright switches that expose automation to the page
+_IGNORED_DEFAULT_ARGS = ('--enable-automation',)
+
+# Patched into every page of the context before any site script runs
+_STEALTH_INIT_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+window.chrome = window.chrome || {runtime: {}};
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+Object.defineProperty(navigator, 'languages', {get: () => ['zh-CN', 'zh', 'en']});
+"""
+
+# Media and font files are blocked; images (captcha) and stylesheets (element visibility) are kept
+_BLOCKED_MEDIA_PATTERN = "**/*.{mp4,avi,mov,wmv,flv,webm,mp3,wav,ogg,woff,woff2,ttf,otf,eot}"
+
+# Third-party analytics and ad hosts the registration flow never needs
+_BLOCKED_TRACKER_PATTERN = re.compile(
+    r'^https?://([^/]*\.)?(hm\.baidu\.com|cnzz\.com|google-analytics\.com|'
+    r'googletagmanager\.com|doubleclick\.net)(:\d+)?/'
+)
+
+# Site registered on; its storage is wiped between accounts along with cookies
+_REGISTRATION_ORIGIN = 'https://wan.360.cn'
+_CLEARED_STORAGE_TYPES = 'local_storage,session_storage,indexeddb,cache_storage,service_workers'
+
 
 class PlaywrightBackend(AutomationBackend):
     """Playwright自动化后端"""
     
+    # Accounts registered in parallel, each in its own browser context
+    max_concurrency = 3
+    
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -26,7 +75,14 @@ class PlaywrightBackend(AutomationBackend):
         # Playwright browser management
         self.playwright: Optional[PlaywrightContextManager] = None
         self.browser: Optional[Browser] = None
-        self.browser_context: Optional[BrowserContext] = None
+        self._browser_lock = asyncio.Lock()
+        
+        # Context pool: idle contexts are reused with their page (cookies cleared), active ones
+        # belong to a running registration, pending ones are kept open for
+        # manual captcha solving and closed on cleanup
+        self._idle_contexts: list[BrowserContext] = []
+        self._active_contexts: set[BrowserContext] = set()
+        self._pending_contexts: list[BrowserContext] = []
     
     def get_backend_name(self) -> str:
         return "playwright"
@@ -41,13 +97,14 @@ class PlaywrightBackend(AutomationBackend):
     
     async def register_account(self, account: Account) -> bool:
         """Register a single account using simplified state machine"""
-        self.logger.debug(f"开始简化状态机注册: {account.username}")
+        self.logger.debug("开始简化状态机注册: %s", account.username)
         
-        # Initialize browser
+        # Initialize browser and take a context from the pool
         try:
             if not await self._initialize_browser():
                 account.mark_failed("Failed to initialize browser")
                 return False
+            context = await self._acquire_context()
         except Exception as e:
             account.mark_failed(f"Browser initialization error: {str(e)}")
             return False
@@ -55,9 +112,9 @@ class PlaywrightBackend(AutomationBackend):
         page: Optional[Page] = None
         
         try:
-            # Create new page
-            page = await self.browser_context.new_page()
-            self._log(tr("Starting registration for: %1").replace("%1", account.username))
+            # Reuse the context's page from the previous account, if any
+            page = context.pages[0] if context.pages else await context.new_page()
+            self._logf("Starting registration for: %1", account.username)
             
             # Create simplified state machine
             state_machine = RegistrationMachine(account, page)
@@ -71,85 +128,94 @@ class PlaywrightBackend(AutomationBackend):
             # Run the state machine
             success = await state_machine.run()
             
-            self.logger.info(f"简化状态机完成 {account.username}: {'SUCCESS' if success else 'FAILED'}")
+            self.logger.info("简化状态机完成 %s: %s", account.username, 'SUCCESS' if success else 'FAILED')
             
             return success
             
         except Exception as e:
-            self.logger.error(f"Unexpected error: {e}", exc_info=True)
+            self.logger.error(f"Unexpected error: {e}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
             account.mark_failed(f"Unexpected error: {str(e)}")
             return False
         finally:
-            # Cleanup based on account status
-            should_close_browser = account.status != AccountStatus.CAPTCHA_PENDING
-            
-            if should_close_browser and page:
-                try:
-                    await page.close()
-                    await self._cleanup_browser()
-                except Exception as e:
-                    self.logger.warning(f"Error during browser cleanup: {e}")
+            # Keep the browser warm for the next account; a captcha-pending page
+            # keeps its context, everything else is closed and its session cleared
+            await self._release_context(context, page, keep_open=account.status == AccountStatus.CAPTCHA_PENDING)
+    
+    async def _acquire_context(self) -> BrowserContext:
+        """Take an idle context from the pool or create a new one"""
+        context = self._idle_contexts.pop() if self._idle_contexts else await self._new_context()
+        self._active_contexts.add(context)
+        return context
+    
+    async def _release_context(self, context: BrowserContext, page: Optional[Page], keep_open: bool):
+        """Return a context to the pool, or hand it over to manual captcha solving"""
+        if context not in self._active_contexts:
+            return  # Closed by reset/cleanup while the registration was running
+        self._active_contexts.discard(context)
+        
+        if keep_open:
+            self._pending_contexts.append(context)
+            return
+        
+        try:
+            if page is None or page.is_closed():
+                # No page left to clear the site's storage through
+                await self._close_context(context)
+                return
+            # Park the page on about:blank so it can be reused by the next account
+            await page.goto('about:blank')
+            # Clear cookies and the site's storage so the next account starts
+            # logged out, keeping the HTTP cache
+            cdp = await context.new_cdp_session(page)
+            try:
+                await cdp.send('Storage.clearDataForOrigin', {
+                    'origin': _REGISTRATION_ORIGIN, 'storageTypes': _CLEARED_STORAGE_TYPES
+                })
+            finally:
+                await cdp.detach()
+            await context.clear_cookies()
+            self._idle_contexts.append(context)
+        except Exception as e:
+            self.logger.warning(f"Error during page cleanup: {e}")
+            await self._close_context(context)
     
     def _on_captcha_detected(self, account: Account, message: str):
         """Handle captcha detection callback"""
-        self._log(tr("⚠️ CAPTCHA DETECTED for %1: %2").replace("%1", account.username).replace("%2", message))
+        self._logf("⚠️ CAPTCHA DETECTED for %1: %2", account.username, message)
         self._log(tr("Browser will stay open - please solve manually"))
     
     def _on_registration_success(self, account: Account, message: str):
         """Handle registration success callback"""
-        self._log(tr("SUCCESS: %1 registered successfully").replace("%1", account.username))
+        self._logf("SUCCESS: %1 registered successfully", account.username)
     
     def _on_registration_failed(self, account: Account, message: str):
         """Handle registration failure callback"""
-        self._log(tr("FAILED: %1 - %2").replace("%1", account.username).replace("%2", message))
+        self._logf("FAILED: %1 - %2", account.username, message)
     
     async def _initialize_browser(self) -> bool:
-        """Initialize Playwright browser and context"""
+        """Initialize Playwright and launch the browser"""
         try:
-            # Initialize Playwright
-            if not self.playwright:
-                self.playwright = await async_playwright().start()
-            
-            # Launch browser
-            if not self.browser:
-                self.browser = await self.playwright.chromium.launch(
-                    headless=False,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-web-security',
-                        '--disable-features=VizDisplayCompositor',
-                        '--no-first-run',
-                        '--no-default-browser-check',
-                        '--disable-dev-shm-usage',
-                        '--disable-extensions',
-                        '--disable-background-timer-throttling',
-                        '--disable-backgrounding-occluded-windows',
-                        '--disable-renderer-backgrounding',
-                        '--no-sandbox',
-                        '--disable-ipc-flooding-protection',
-                        '--disable-hang-monitor',
-                        '--disable-prompt-on-repost',
-                        '--disable-sync',
-                        '--force-color-profile=srgb',
-                        '--metrics-recording-only',
-                        '--use-mock-keychain',
-                        '--disable-background-networking',
-                    ],
-                    slow_mo=100,
-                    timeout=60000
-                )
-            
-            # Create browser context
-            if not self.browser_context:
-                self.browser_context = await self.browser.new_context(
-                    viewport=ViewportSize({'width': 1280, 'height': 720}),
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
+            async with self._browser_lock:
+                # Initialize Playwright
+                if not self.playwright:
+                    self.playwright = await async_playwright().start()
                 
-                # Block media files but keep images for captcha
-                await self.browser_context.route("**/*.{mp4,avi,mov,wmv,flv,webm,mp3,wav,ogg}", lambda route: route.abort())
-            
-            self._log(tr("Browser initialized successfully"))
+                # Relaunch if the browser window was closed since the last account
+                if self.browser and not self.browser.is_connected():
+                    self.browser = None
+                    self._idle_contexts.clear()
+                    self._active_contexts.clear()
+                    self._pending_contexts.clear()
+                
+                # Launch browser
+                if not self.browser:
+                    self.browser = await self.playwright.chromium.launch(
+                        headless=False,
+                        args=list(_CHROMIUM_ARGS),
+                        ignore_default_args=list(_IGNORED_DEFAULT_ARGS),
+                        timeout=60000
+                    )
+                    self._log(tr("Browser initialized successfully"))
             return True
             
         except Exception as e:
@@ -157,12 +223,42 @@ class PlaywrightBackend(AutomationBackend):
             self.logger.error(str(error))
             raise error
     
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with stealth patches and resource blocking"""
+        context = await self.browser.new_context(
+            viewport=ViewportSize({'width': 1280, 'height': 720}),
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        )
+        
+        # Hide automation markers once per context instead of per page
+        await context.add_init_script(_STEALTH_INIT_SCRIPT)
+        
+        # Block media and font files but keep images for captcha
+        await context.route(_BLOCKED_MEDIA_PATTERN, lambda route: route.abort())
+        await context.route(_BLOCKED_TRACKER_PATTERN, lambda route: route.abort())
+        return context
+    
+    async def _close_contexts(self):
+        """Close pooled, running and captcha-pending contexts"""
+        contexts = self._idle_contexts + list(self._active_contexts) + self._pending_contexts
+        self._idle_contexts = []
+        self._active_contexts = set()
+        self._pending_contexts = []
+        
+        for context in contexts:
+            await self._close_context(context)
+    
+    async def _close_context(self, context: BrowserContext):
+        """Close a context, logging instead of raising on failure"""
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing browser context: {e}")
+    
     async def _cleanup_browser(self):
         """Clean up Playwright browser resources"""
         try:
-            if self.browser_context:
-                await self.browser_context.close()
-                self.browser_context = None
+            await self._close_contexts()
             
             if self.browser:
                 await self.browser.close()
@@ -176,13 +272,24 @@ class PlaywrightBackend(AutomationBackend):
         except Exception as e:
             self.logger.warning(f"Error during browser cleanup: {e}")
     
+    async def reset_async(self):
+        """Abort in-flight registrations by closing contexts, keeping the browser running"""
+        await self._close_contexts()
+    
+    async def cleanup_async(self):
+        """Clean up backend resources on the event loop that owns the browser"""
+        await self._cleanup_browser()
+    
     def cleanup(self):
         """Clean up backend resources (sync interface)"""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(self._cleanup_browser())
-            else:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
                 asyncio.run(self._cleanup_browser())
+            else:
+                # Blocking on the running loop would deadlock; callers that need
+                # to wait use cleanup_async instead
+                loop.create_task(self._cleanup_browser())
         except Exception as e:
             self.logger.warning(f"Error in sync cleanup: {e}")
\ No newline at end of file
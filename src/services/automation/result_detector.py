@@ -6,7 +6,7 @@ including success, failure, captcha, and error conditions.
 """
 
 import re
-from typing import Tuple
+from typing import Set, Tuple
 from ...models.account import Account
 from ...exceptions import (
     AccountAlreadyExistsError, CaptchaRequiredError, RegistrationFailureError
@@ -14,6 +14,36 @@ from ...exceptions import (
 from ...translation_manager import tr
 
 
+def _occurrence_pattern(indicators) -> re.Pattern:
+    """
+    Compile indicators into one pattern whose findall() yields the indicators present
+    
+    The alternation sits in a lookahead, so matches never consume text and an
+    indicator overlapping another at a different offset is still reported. At
+    any one offset only the longest indicator is reported, so an indicator that
+    is a prefix of another is lost there; see find_indicators.
+    """
+    alternation = '|'.join(re.escape(i) for i in sorted(indicators, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+
+def _prefix_indicators(indicators) -> Tuple[str, ...]:
+    """Indicators that are a proper prefix of another indicator"""
+    return tuple(i for i in indicators if any(o != i and o.startswith(i) for o in indicators))
+
+
+def find_indicators(pattern: re.Pattern, prefixes: Tuple[str, ...], text: str) -> Set[str]:
+    """
+    Return every indicator present in text
+    
+    One scan with the occurrence pattern, plus a substring check for each
+    prefix indicator the pattern did not report.
+    """
+    found = set(pattern.findall(text))
+    found.update(i for i in prefixes if i not in found and i in text)
+    return found
+
+
 class RegistrationResultDetector:
     """Detects registration results from page content"""
     
@@ -72,6 +102,18 @@ class RegistrationResultDetector:
         "验证码不能为空"
     ]
     
+    # Every indicator above
+    ALL_INDICATORS = tuple(
+        CAPTCHA_INDICATORS['high_specificity'] + CAPTCHA_INDICATORS['auxiliary'] +
+        SUCCESS_INDICATORS + ALREADY_REGISTERED_MESSAGES +
+        EXPLICIT_SUCCESS_MESSAGES + ERROR_MESSAGES
+    )
+    
+    # Finds them in one pass over the page content; prefixes of other
+    # indicators (none at present) are checked separately
+    _INDICATOR_PATTERN = _occurrence_pattern(ALL_INDICATORS)
+    _PREFIX_INDICATORS = _prefix_indicators(ALL_INDICATORS)
+    
     @staticmethod
     def detect_registration_result(page_content: str, account: Account) -> Tuple[bool, str]:
         """
@@ -90,38 +132,57 @@ class RegistrationResultDetector:
             RegistrationFailureError: If registration failed with specific error
         """
         
+        found = find_indicators(
+            RegistrationResultDetector._INDICATOR_PATTERN,
+            RegistrationResultDetector._PREFIX_INDICATORS,
+            page_content
+        )
+        return RegistrationResultDetector.detect_from_indicators(found, account)
+    
+    @staticmethod
+    def detect_from_indicators(found: Set[str], account: Account) -> Tuple[bool, str]:
+        """
+        Detect registration result from the indicators present on the page
+        
+        Lets callers collect ALL_INDICATORS inside the browser instead of
+        transferring the page HTML. Returns and raises like detect_registration_result.
+        """
+        # The checks below keep their list priority
+        if not found:
+            return False, "Registration result unclear"
+        
         # 检测验证码 - 只要检测到一个高特异性指标即可确认
         for indicator in RegistrationResultDetector.CAPTCHA_INDICATORS['high_specificity']:
-            if indicator in page_content:
+            if indicator in found:
                 return False, f"CAPTCHA_DETECTED: {indicator}"
         
         # 辅助验证码检测 - 需要多个条件同时满足
         auxiliary_indicators = RegistrationResultDetector.CAPTCHA_INDICATORS['auxiliary']
-        auxiliary_found = [indicator for indicator in auxiliary_indicators[:2] if indicator in page_content]
+        auxiliary_found = [indicator for indicator in auxiliary_indicators[:2] if indicator in found]
         if len(auxiliary_found) >= 2:
             return False, "CAPTCHA_DETECTED: slide verification interface"
         
         # 检测成功登录 - 需要多个登录特征同时存在
         login_features_found = sum(
             1 for indicator in RegistrationResultDetector.SUCCESS_INDICATORS 
-            if indicator in page_content
+            if indicator in found
         )
         if login_features_found >= 3:  # 至少3个登录特征同时存在
             return True, f"Registration successful - login interface detected ({login_features_found} features)"
         
         # Check for already registered messages
         for message in RegistrationResultDetector.ALREADY_REGISTERED_MESSAGES:
-            if message in page_content:
+            if message in found:
                 raise AccountAlreadyExistsError(account.username, message)
         
         # Check for explicit success messages
         for indicator in RegistrationResultDetector.EXPLICIT_SUCCESS_MESSAGES:
-            if indicator in page_content:
+            if indicator in found:
                 return True, f"Registration successful (detected: {indicator})"
         
         # Check for error messages
         for message in RegistrationResultDetector.ERROR_MESSAGES:
-            if message in page_content:
+            if message in found:
                 if "验证码" in message:
                     raise CaptchaRequiredError("text_captcha")
                 else:
@@ -4,14 +4,16 @@ Selenium backend implementation for automation
 Handles all Selenium/undetected_chromedriver specific browser automation logic for account registration.
 """
 
-import time
+import asyncio
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Set
 
 from .base_backend import AutomationBackend
-from .form_helpers import FormSelectors, RetryHelper
+from .form_helpers import FILL_FORM_JS, FormSelectors, RetryHelper
 from .result_detector import RegistrationResultDetector
-from ...models.account import Account, AccountStatus
+from ...models.account import Account
 from ...translation_manager import tr
 from ...exceptions import (
     BrowserInitializationError, RegistrationFailureError,
@@ -38,14 +40,258 @@ except ImportError:
     NoSuchElementException = None
     WebDriverException = None
 
+# Chrome arguments applied to every undetected_chromedriver instance
+_CHROME_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-ipc-flooding-protection',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-sync',
+    '--force-color-profile=srgb',
+    '--metrics-recording-only',
+    '--use-mock-keychain',
+    '--disable-background-networking',
+    '--window-size=1280,720',
+)
+
+# Locator polling: every FAST_POLL_INTERVAL seconds for the first FAST_POLL_PERIOD
+# seconds of a wait (most elements appear within it), then backing off by doubling
+# up to MAX_POLL_INTERVAL to cut round-trips on long waits
+FAST_POLL_INTERVAL = 0.25
+FAST_POLL_PERIOD = 5
+MAX_POLL_INTERVAL = 2.0
+
+
+def _short_error(e: Exception) -> str:
+    """One-line description of an exception, without Selenium's session info and stacktrace"""
+    first_line = (getattr(e, 'msg', None) or str(e)).partition('\n')[0]
+    return f"{type(e).__name__}: {first_line}"
+
+
+# Resolves a whole fallback locator list in one script call: returns [index, element]
+# for the first locator with a displayed match, or null. Supports the locator
+# strategies used below (css selector, name, link text, partial link text).
+_FIND_DISPLAYED_JS = """
+const locators = arguments[0];
+const displayed = e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden';
+// Link texts are collected in one pass and shared by all link text locators
+let links = null;
+const linkTexts = () => links || (links = [...document.links].map(a => [a, a.innerText]));
+const linksWhere = match => linkTexts().filter(([, text]) => match(text)).map(([a]) => a);
+for (let i = 0; i < locators.length; i++) {
+    const [by, value] = locators[i];
+    let candidates;
+    try {
+        if (by === 'css selector') {
+            candidates = document.querySelectorAll(value);
+        } else if (by === 'name') {
+            candidates = document.getElementsByName(value);
+        } else if (by === 'link text') {
+            candidates = linksWhere(text => text.trim() === value);
+        } else if (by === 'partial link text') {
+            candidates = linksWhere(text => text.includes(value));
+        } else {
+            continue;
+        }
+    } catch (e) {
+        continue;
+    }
+    const element = [...candidates].find(displayed);
+    if (element) return [i, element];
+}
+return null;
+"""
+
+
+# The shared fill-form script, called through execute_script
+_FILL_FORM_SCRIPT = f"return ({FILL_FORM_JS})(arguments[0]);"
+
+# Returns the given texts that appear in the visible page text
+_PRESENT_TEXTS_JS = """
+const text = document.body ? document.body.innerText : '';
+return arguments[0].filter(t => text.includes(t));
+"""
+
+# Messages that end the wait for the logout link early. Captcha prompts are
+# left out so the user can still solve one while verification waits.
+_FAILURE_MESSAGES = [
+    message for message in (
+        RegistrationResultDetector.ALREADY_REGISTERED_MESSAGES + RegistrationResultDetector.ERROR_MESSAGES
+    )
+    if "验证码" not in message
+]
+
+
+def _css_locators(locators) -> List[str]:
+    """CSS equivalents of css selector and name locators, in order"""
+    css = []
+    for by, value in locators:
+        if by == By.CSS_SELECTOR:
+            css.append(value)
+        elif by == By.NAME:
+            css.append(f'[name="{value}"]')
+    return css
+
+
+class _FormStep(NamedTuple):
+    """One element interaction of the registration flow"""
+    locators: tuple
+    timeout: float
+    action: str  # 'fill', 'check' or 'click'
+    value: Optional[str]  # Account attribute typed by 'fill' steps
+    error: str
+    message: str  # Log line, %1 is the username
+
+
+# The registration popup's form; the modal-scoped entries come first in their lists
+_MODAL_FORM = FormSelectors.REGISTRATION_MODAL_FORM
+
+# Fallback locator lists, in priority order, and the form steps built on them
+# (built once; By is only usable when selenium is installed)
+if SELENIUM_AVAILABLE:
+    _REGISTRATION_BUTTON_SELECTORS = (
+        (By.CSS_SELECTOR, '.quc-link-sign-up'),
+        (By.CSS_SELECTOR, '.wan-register-btn'),
+        (By.CSS_SELECTOR, 'a[data-bk="wan-public-reg"]'),
+        (By.LINK_TEXT, '免费注册'),
+        (By.LINK_TEXT, '注册'),
+        (By.LINK_TEXT, '立即注册'),
+        (By.CSS_SELECTOR, 'a[href*="register"]'),
+        (By.CSS_SELECTOR, '.quc-mod-sign-in form a.quc-link-sign-up'),
+    )
+    
+    _REGISTRATION_FORM_SELECTOR = (
+        By.CSS_SELECTOR, f'{_MODAL_FORM}, .modal form, .popup form, .register-form'
+    )
+    
+    _USERNAME_SELECTORS = (
+        (By.CSS_SELECTOR, f'{_MODAL_FORM} input[name="username"]'),
+        (By.NAME, 'username'),
+        (By.CSS_SELECTOR, 'input[placeholder*="用户名"]'),
+        (By.CSS_SELECTOR, 'input[placeholder*="账号"]'),
+        (By.CSS_SELECTOR, 'form input[type="text"]:first-of-type'),
+    )
+    
+    _PASSWORD_SELECTORS = (
+        (By.CSS_SELECTOR, f'{_MODAL_FORM} input[name="password"]'),
+        (By.NAME, 'password'),
+        (By.CSS_SELECTOR, 'input[placeholder*="密码"]'),
+        (By.CSS_SELECTOR, 'input[type="password"]:first-of-type'),
+    )
+    
+    _CONFIRM_PASSWORD_SELECTORS = (
+        (By.CSS_SELECTOR, f'{_MODAL_FORM} input[name="password2"]'),
+        (By.NAME, 'password2'),
+        (By.NAME, 'confirm_password'),
+        (By.NAME, 'password_confirm'),
+        (By.CSS_SELECTOR, 'input[placeholder*="确认密码"]'),
+        (By.CSS_SELECTOR, 'input[placeholder*="再次输入"]'),
+    )
+    
+    _TERMS_SELECTORS = (
+        (By.CSS_SELECTOR, f'{_MODAL_FORM} label input[type="checkbox"]'),
+        (By.CSS_SELECTOR, 'form label input[type="checkbox"]'),
+        (By.CSS_SELECTOR, 'form input[type="checkbox"]'),
+    )
+    
+    _SUBMIT_SELECTORS = (
+        (By.CSS_SELECTOR, f'{_MODAL_FORM} input[type="submit"]'),
+        (By.CSS_SELECTOR, 'form input[type="submit"]'),
+        (By.CSS_SELECTOR, 'form button[type="submit"]'),
+    )
+    
+    _LOGOUT_LINK_SELECTORS = (
+        (By.CSS_SELECTOR, 'a.wan-logout-btn'),
+        (By.PARTIAL_LINK_TEXT, '[退出]'),
+    )
+    
+    _OPEN_FORM_STEP = _FormStep(
+        _REGISTRATION_BUTTON_SELECTORS, 10, 'click', None,
+        "Could not find or click any registration button", "Clicked registration button"
+    )
+    
+    _FORM_STEPS = (
+        _FormStep(_USERNAME_SELECTORS, 5, 'fill', 'username',
+                  "Could not find or fill username field", "Filled username: %1"),
+        _FormStep(_PASSWORD_SELECTORS, 5, 'fill', 'password',
+                  "Could not find or fill password field", "Filled password"),
+        _FormStep(_CONFIRM_PASSWORD_SELECTORS, 5, 'fill', 'password',
+                  "Could not find or fill confirm password field", "Filled confirm password"),
+        _FormStep(_TERMS_SELECTORS, 5, 'check', None,
+                  "Could not find terms agreement checkbox", "Checked terms agreement"),
+    )
+    
+    # Fill-form script arguments: (CSS fallbacks, account attribute) per field
+    _FILL_FIELDS = tuple(
+        (_css_locators(step.locators), step.value) for step in _FORM_STEPS if step.action == 'fill'
+    )
+    _FILL_CHECKBOXES = _css_locators(_TERMS_SELECTORS)
+    
+    _SUBMIT_STEP = _FormStep(
+        _SUBMIT_SELECTORS, 5, 'click', None,
+        "Could not find or click submit button", "Clicked registration confirm button"
+    )
+
+
+# Site registered on; its storage is wiped between accounts along with cookies
+_REGISTRATION_URL = 'https://wan.360.cn/'
+_REGISTRATION_ORIGIN = 'https://wan.360.cn'
+_CLEARED_STORAGE_TYPES = 'local_storage,session_storage,indexeddb,cache_storage,service_workers'
+
+# Media, fonts and third-party analytics the registration flow never needs;
+# images stay allowed because the slider captcha is drawn from them
+_BLOCKED_URLS = [
+    '*.mp4', '*.avi', '*.mov', '*.wmv', '*.flv', '*.webm', '*.mp3', '*.wav', '*.ogg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*hm.baidu.com/*', '*cnzz.com/*', '*google-analytics.com/*',
+    '*googletagmanager.com/*', '*doubleclick.net/*',
+]
+
+# Seconds driver.get() may take to reach DOMContentLoaded before it is retried
+PAGE_LOAD_TIMEOUT = 30
+
+# Seconds to wait before each navigation retry, scaled by how the attempt failed
+# and capped at MAX_NAVIGATION_RETRY_DELAY
+NAVIGATION_RETRY_DELAYS = (0.2, 0.5, 1.5)
+MAX_NAVIGATION_RETRY_DELAY = 3.0
+
+# Accounts a pooled browser registers before it is replaced, so a long batch
+# does not run every sign-up from one browser fingerprint
+SESSION_MAX_USES = 25
+
+
+class _BrowserSession(NamedTuple):
+    """A pooled browser and the blank tab that keeps its session open"""
+    driver: object
+    home_handle: str
+
 
 class SeleniumBackend(AutomationBackend):
     """Selenium/undetected_chromedriver automation backend"""
     
+    # Each registration runs in a worker thread with its own browser
+    max_concurrency = 2
+    
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self.selenium_driver: Optional[object] = None
+        # Browser pool: idle sessions are reused by the next account
+        self._idle_sessions: List[_BrowserSession] = []
+        self._active_sessions: Set[_BrowserSession] = set()
+        self._session_uses: Dict[_BrowserSession, int] = {}
+        # Guards the pool and serializes launches (undetected_chromedriver
+        # patches its driver binary on every launch)
+        self._pool_lock = threading.Lock()
+        # Locator that last matched, per fallback list
+        self._selector_hits: Dict[tuple, tuple] = {}
         
         if not SELENIUM_AVAILABLE:
             raise BrowserInitializationError(
@@ -64,320 +310,339 @@ class SeleniumBackend(AutomationBackend):
     
     async def register_account(self, account: Account) -> bool:
         """Register a single account using Selenium automation"""
-        # Selenium backend is synchronous, so we implement this directly
-        return self._register_account_sync(account)
+        # Selenium is blocking, so it runs in a worker thread to keep the event
+        # loop free for the other accounts of the batch
+        return await asyncio.to_thread(self._register_account_sync, account)
     
     def _register_account_sync(self, account: Account) -> bool:
         """Synchronous account registration implementation"""
-        self.logger.debug(f"Starting selenium registration for: {account.username}")
+        self.logger.debug("Starting selenium registration for: %s", account.username)
         
-        if not self._initialize_selenium_driver():
+        session = self._acquire_session()
+        if session is None:
             account.mark_failed("Failed to initialize selenium driver")
             return False
         
+        driver = session.driver
+        # Bound once: the steps below log after nearly every action
+        log = self._log
+        logf = self._logf
+        
         try:
+            # Each account gets its own tab in its browser; URL blocking is
+            # per tab, so it is set up again for every new one
+            driver.switch_to.new_window('tab')
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+            
             # Mark account as processing
             account.mark_processing(tr("Initializing browser for registration"))
-            self._log(tr("Starting registration for: %1").replace("%1", account.username))
+            logf("Starting registration for: %1", account.username)
             
             # Step 1: Navigate to 360.cn with retry logic
             account.mark_processing(tr("Navigating to 360.cn"))
-            self._navigate_with_retry('https://wan.360.cn/', max_retries=3)
-            self._log(tr("Navigated to 360.cn"))
-            
-            # Wait for page to load completely
-            time.sleep(5)
+            self._navigate_with_retry(driver, _REGISTRATION_URL, max_retries=3)
+            log(tr("Navigated to 360.cn"))
             
             # Step 2: Click registration button
             account.mark_processing(tr("Opening registration form"))
-            self._click_registration_button()
-            self._log(tr("Clicked registration button"))
+            self._run_step(driver, _OPEN_FORM_STEP, account, logf)
             
             # Wait for registration form
-            self._wait_for_registration_form()
-            time.sleep(2)
+            self._wait_for_registration_form(driver)
             
             # Step 3-6: Fill form fields
             account.mark_processing(tr("Filling registration form"))
+            if not self._fill_form(driver, account, logf):
+                for step in _FORM_STEPS:
+                    self._run_step(driver, step, account, logf)
             
-            self._fill_username_field(account.username)
-            self._log(tr("Filled username: %1").replace("%1", account.username))
-            
-            self._fill_password_field(account.password)
-            self._log(tr("Filled password"))
-            
-            self._fill_confirm_password_field(account.password)
-            self._log(tr("Filled confirm password"))
-            
-            self._check_terms_agreement()
-            self._log(tr("Checked terms agreement"))
-            
-            # Step 7: Submit form
+            # Step 7: Submit form; failure messages already on the page are ignored afterwards
             account.mark_processing(tr("Submitting registration"))
-            self._click_submit_button()
-            self._log(tr("Clicked registration confirm button"))
-            
-            time.sleep(3)  # Wait for submission processing
+            shown_before = self._present_texts(driver, _FAILURE_MESSAGES)
+            self._run_step(driver, _SUBMIT_STEP, account, logf)
             
-            # Step 8: Verify result using selenium-specific method
+            # Step 8: Verify result (waits for the logout link instead of a fixed delay)
             account.mark_processing(tr("Verifying registration result"))
-            self._verify_registration_success(account)
-            
-            return account.status == AccountStatus.SUCCESS
+            return self._verify_registration_success(driver, account, shown_before)
             
         except Exception as e:
-            error_msg = f"Registration failed: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
+            error_msg = f"Registration failed: {_short_error(e)}"
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             account.mark_failed(error_msg)
-            self._log(tr("FAILED: %1 - %2").replace("%1", account.username).replace("%2", error_msg))
+            logf("FAILED: %1 - %2", account.username, error_msg)
             return False
         finally:
-            # Always cleanup selenium driver after registration attempt
-            self._cleanup_selenium_driver()
+            # Keep the browser for the next account, only drop this account's tab
+            self._release_session(session)
+    
+    def _acquire_session(self) -> Optional[_BrowserSession]:
+        """Take an idle browser from the pool, launching one if none is left"""
+        with self._pool_lock:
+            while self._idle_sessions:
+                session = self._idle_sessions.pop()
+                if self._session_alive(session):
+                    self._active_sessions.add(session)
+                    return session
+                self._log(tr("Selenium browser was closed, starting a new one"))
+                self._session_uses.pop(session, None)
+                self._quit_session(session)
+            
+            session = self._launch_session()
+            if session is not None:
+                self._active_sessions.add(session)
+            return session
     
-    def _initialize_selenium_driver(self) -> bool:
-        """Initialize undetected_chromedriver instance"""
+    @staticmethod
+    def _build_chrome_options():
+        """Build Chrome options for anti-detection (uc needs a fresh instance per driver)"""
+        options = uc.ChromeOptions()
+        for arg in _CHROME_ARGS:
+            options.add_argument(arg)
+        
+        # driver.get() returns at DOMContentLoaded instead of the full load;
+        # each step then waits for the element it actually needs
+        options.page_load_strategy = 'eager'
+        return options
+    
+    def _launch_session(self) -> Optional[_BrowserSession]:
+        """Launch an undetected_chromedriver instance"""
         try:
-            self._log(tr("DEBUG: Starting selenium driver initialization"))
+            self._logf("DEBUG: Starting selenium driver initialization")
             
-            if not self.selenium_driver:
-                # Configure Chrome options for anti-detection
-                options = uc.ChromeOptions()
-                
-                # Add anti-detection arguments
-                anti_detection_args = [
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-dev-shm-usage',
-                    '--disable-extensions',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-hang-monitor',
-                    '--disable-prompt-on-repost',
-                    '--disable-sync',
-                    '--force-color-profile=srgb',
-                    '--metrics-recording-only',
-                    '--use-mock-keychain',
-                    '--disable-background-networking',
-                    '--window-size=1280,720'
-                ]
-                
-                for arg in anti_detection_args:
-                    options.add_argument(arg)
-                
-                # Create the undetected Chrome driver
-                self.selenium_driver = uc.Chrome(
-                    options=options,
-                    headless=False,
-                    use_subprocess=True,
-                    suppress_welcome=True
-                )
-                
-                self._log(tr("DEBUG: Undetected Chrome driver created successfully"))
+            # Create the undetected Chrome driver
+            driver = uc.Chrome(
+                options=self._build_chrome_options(),
+                headless=False,
+                use_subprocess=True,
+                suppress_welcome=True
+            )
+            
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            
+            self._logf("DEBUG: Undetected Chrome driver created successfully")
             
             self._log(tr("Selenium driver initialized successfully"))
-            return True
+            return _BrowserSession(driver, driver.current_window_handle)
             
         except Exception as e:
-            error_msg = f"Selenium driver initialization failed: {str(e)}"
-            self._log(tr("ERROR: %1").replace("%1", error_msg))
+            error_msg = f"Selenium driver initialization failed: {_short_error(e)}"
+            self._logf("ERROR: %1", error_msg)
+            return None
+    
+    def _session_alive(self, session: _BrowserSession) -> bool:
+        """Check that a pooled browser still has its home tab"""
+        try:
+            return session.home_handle in session.driver.window_handles
+        except WebDriverException:
             return False
     
-    def _cleanup_selenium_driver(self):
-        """Clean up selenium driver resources"""
+    def _release_session(self, session: _BrowserSession):
+        """Close the account's tab, clear site data and return the browser to the pool"""
+        with self._pool_lock:
+            if session not in self._active_sessions:
+                # Cleaned up while the account was running
+                return
+            self._active_sessions.discard(session)
+            uses = self._session_uses.pop(session, 0) + 1
+        
+        if uses >= SESSION_MAX_USES:
+            self._quit_session(session)
+            return
+        
+        driver = session.driver
         try:
-            if self.selenium_driver:
-                self._log(tr("DEBUG: Closing selenium driver"))
-                self.selenium_driver.quit()
-                self.selenium_driver = None
-                self._log(tr("DEBUG: Selenium driver closed"))
-            
-            self._log(tr("Selenium driver resources cleaned up"))
+            if driver.current_window_handle != session.home_handle:
+                driver.close()
+            driver.switch_to.window(session.home_handle)
+            # Cookies are shared by all tabs; clearing them keeps the next
+            # account from starting logged in as this one
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': _REGISTRATION_ORIGIN, 'storageTypes': _CLEARED_STORAGE_TYPES
+            })
+        except WebDriverException as e:
+            self._logf("WARNING: %1", f"Failed to reset browser tab: {_short_error(e)}")
+            self._quit_session(session)
+            return
+        
+        with self._pool_lock:
+            self._session_uses[session] = uses
+            self._idle_sessions.append(session)
+    
+    def _quit_session(self, session: _BrowserSession):
+        """Quit one pooled browser"""
+        try:
+            self._logf("DEBUG: Closing selenium driver")
+            session.driver.quit()
+            self._logf("DEBUG: Selenium driver closed")
         except Exception as e:
-            error_msg = f"Selenium driver cleanup error: {str(e)}"
-            self._log(tr("WARNING: %1").replace("%1", error_msg))
+            error_msg = f"Selenium driver cleanup error: {_short_error(e)}"
+            self._logf("WARNING: %1", error_msg)
+    
+    def _cleanup_selenium_driver(self):
+        """Quit every pooled browser, including those of running accounts"""
+        with self._pool_lock:
+            sessions = self._idle_sessions + list(self._active_sessions)
+            self._idle_sessions.clear()
+            self._active_sessions.clear()
+            self._session_uses.clear()
+        
+        for session in sessions:
+            self._quit_session(session)
+        
+        self._log(tr("Selenium driver resources cleaned up"))
     
     def cleanup(self):
         """Clean up backend resources"""
         self._cleanup_selenium_driver()
     
     # Helper methods for form interaction using Selenium
-    def _navigate_with_retry(self, url: str, max_retries: int = 3):
+    def _navigate_with_retry(self, driver, url: str, max_retries: int = 3):
         """Navigate to URL with retry logic"""
         for attempt in range(max_retries):
             try:
-                self._log(tr("DEBUG: Navigation attempt %1/%2").replace("%1", str(attempt + 1)).replace("%2", str(max_retries)))
-                
-                self.selenium_driver.get(url)
+                self._logf("DEBUG: Navigation attempt %1/%2", attempt + 1, max_retries)
                 
-                # Wait for page to load
-                WebDriverWait(self.selenium_driver, 60).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                )
+                # Returns at DOMContentLoaded (eager page load strategy); the
+                # registration button wait that follows is the readiness check
+                driver.get(url)
                 return
                 
             except Exception as e:
                 if attempt < max_retries - 1:
-                    self._log(tr("DEBUG: Navigation attempt %1 failed: %2, retrying...").replace("%1", str(attempt + 1)).replace("%2", str(e)))
-                    time.sleep(2)
+                    self._logf("DEBUG: Navigation attempt %1 failed: %2, retrying...", attempt + 1, _short_error(e))
+                    time.sleep(self._navigation_retry_delay(attempt, e))
                     continue
                 else:
-                    raise Exception(f"Failed to navigate to {url} after {max_retries} attempts: {str(e)}")
-    
-    def _click_registration_button(self):
-        """Click registration button using multiple selector strategies"""
-        selenium_selectors = [
-            (By.CSS_SELECTOR, '.quc-link-sign-up'),
-            (By.CSS_SELECTOR, '.wan-register-btn'),
-            (By.CSS_SELECTOR, 'a[data-bk="wan-public-reg"]'),
-            (By.LINK_TEXT, '免费注册'),
-            (By.LINK_TEXT, '注册'),
-            (By.LINK_TEXT, '立即注册'),
-            (By.CSS_SELECTOR, 'a[href*="register"]'),
-            (By.XPATH, '/html/body/div/div/div[2]/div/div/div/div[2]/form/div[6]/div[2]/a[1]'),
-        ]
-        
-        for by, selector in selenium_selectors:
-            try:
-                elements = self.selenium_driver.find_elements(by, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        element.click()
-                        return
-            except Exception:
-                continue
-        
-        raise Exception("Could not find or click any registration button")
+                    # Re-raise the original Selenium exception so its type survives
+                    self.logger.error("Failed to navigate to %s after %d attempts", url, max_retries)
+                    raise
     
-    def _wait_for_registration_form(self):
-        """Wait for registration form to appear"""
-        modal_selectors = [
-            (By.XPATH, '/html/body/div[9]/div[2]/div/div/div/form'),
-            (By.CSS_SELECTOR, '.modal form'),
-            (By.CSS_SELECTOR, '.popup form'),
-            (By.CSS_SELECTOR, '.register-form'),
-        ]
-        
-        for by, selector in modal_selectors:
-            try:
-                WebDriverWait(self.selenium_driver, 5).until(
-                    EC.presence_of_element_located((by, selector))
-                )
-                return
-            except TimeoutException:
-                continue
-    
-    def _fill_username_field(self, username: str):
-        """Fill username field using multiple selector strategies"""
-        username_selectors = [
-            (By.XPATH, '/html/body/div[9]/div[2]/div/div/div/form/div[1]/div/div[1]/div/div/input'),
-            (By.NAME, 'username'),
-            (By.CSS_SELECTOR, 'input[placeholder*="用户名"]'),
-            (By.CSS_SELECTOR, 'input[placeholder*="账号"]'),
-            (By.CSS_SELECTOR, 'form input[type="text"]:first-of-type'),
-        ]
-        
-        for by, selector in username_selectors:
-            try:
-                elements = self.selenium_driver.find_elements(by, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        element.clear()
-                        element.send_keys(username)
-                        return
-            except Exception:
-                continue
-        
-        raise Exception("Could not find or fill username field")
-    
-    def _fill_password_field(self, password: str):
-        """Fill password field"""
-        password_selectors = [
-            (By.XPATH, '/html/body/div[9]/div[2]/div/div/div/form/div[1]/div/div[2]/div/div/input'),
-            (By.NAME, 'password'),
-            (By.CSS_SELECTOR, 'input[placeholder*="密码"]'),
-            (By.CSS_SELECTOR, 'input[type="password"]:first-of-type'),
-        ]
-        
-        for by, selector in password_selectors:
-            try:
-                elements = self.selenium_driver.find_elements(by, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        element.clear()
-                        element.send_keys(password)
-                        return
-            except Exception:
-                continue
-        
-        raise Exception("Could not find or fill password field")
+    def _navigation_retry_delay(self, attempt: int, error: Exception) -> float:
+        """Backoff before retrying a navigation, depending on the failure"""
+        delay = NAVIGATION_RETRY_DELAYS[min(attempt, len(NAVIGATION_RETRY_DELAYS) - 1)]
+        if isinstance(error, TimeoutException):
+            # The page load itself already waited; retry almost immediately
+            delay *= 0.3
+        elif isinstance(error, ConnectionError):
+            # The driver connection needs longer to recover
+            delay *= 2.0
+        return min(delay, MAX_NAVIGATION_RETRY_DELAY)
     
-    def _fill_confirm_password_field(self, password: str):
-        """Fill confirm password field"""
-        confirm_selector = (By.XPATH, '/html/body/div[9]/div[2]/div/div/div/form/div[1]/div/div[3]/div/div/input')
-        
+    def _find_displayed(self, driver, selectors):
+        """Return (locator, element) for the first displayed match of any selector, or None"""
+        # One script call per WebDriverWait poll instead of a find_elements and an
+        # is_displayed round-trip per locator and candidate
         try:
-            element = WebDriverWait(self.selenium_driver, 5).until(
-                EC.element_to_be_clickable(confirm_selector)
-            )
-            element.clear()
-            element.send_keys(password)
-        except Exception as e:
-            raise Exception(f"Failed to fill confirm password: {str(e)}")
+            match = driver.execute_script(_FIND_DISPLAYED_JS, selectors)
+        except WebDriverException:
+            return None
+        if match is None:
+            return None
+        index, element = match
+        return selectors[index], element
     
-    def _check_terms_agreement(self):
-        """Check terms agreement checkbox"""
-        terms_selector = (By.XPATH, '/html/body/div[9]/div[2]/div/div/div/form/div[2]/label/input')
-        
+    def _present_texts(self, driver, texts) -> List[str]:
+        """Return the texts that appear in the visible page text"""
         try:
-            element = WebDriverWait(self.selenium_driver, 5).until(
-                EC.element_to_be_clickable(terms_selector)
-            )
+            return driver.execute_script(_PRESENT_TEXTS_JS, texts)
+        except WebDriverException:
+            return []
+    
+    def _wait_for_displayed(self, driver, selectors, timeout: float, give_up=None):
+        """
+        Wait until any selector matches a displayed element, or None on timeout
+        
+        give_up, if given, is called after each unsuccessful poll; a truthy
+        result ends the wait early with None.
+        """
+        # The locator that matched last time is probed first
+        hit = self._selector_hits.get(selectors)
+        probes = selectors if hit is None else (hit,) + tuple(s for s in selectors if s != hit)
+        start = time.monotonic()
+        deadline = start + timeout
+        interval = FAST_POLL_INTERVAL
+        while True:
+            match = self._find_displayed(driver, probes)
+            if match is not None:
+                locator, element = match
+                self._selector_hits[selectors] = locator
+                return element
+            if give_up is not None and give_up():
+                return None
+            now = time.monotonic()
+            if now >= deadline:
+                return None
+            if now - start >= FAST_POLL_PERIOD:
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+            time.sleep(min(interval, deadline - now))
+    
+    def _run_step(self, driver, step: _FormStep, account: Account, logf):
+        """Locate a step's element and perform its action"""
+        element = self._wait_for_displayed(driver, step.locators, step.timeout)
+        if element is None:
+            raise Exception(step.error)
+        
+        if step.action == 'fill':
+            element.clear()
+            element.send_keys(getattr(account, step.value))
+        elif step.action == 'check':
             if not element.is_selected():
                 element.click()
-        except Exception as e:
-            raise Exception(f"Failed to check terms agreement: {str(e)}")
+        else:
+            element.click()
+        
+        logf(step.message, account.username)
     
-    def _click_submit_button(self):
-        """Click submit button"""
-        submit_selector = (By.XPATH, '/html/body/div[9]/div[2]/div/div/div/form/div[3]/input')
+    def _fill_form(self, driver, account: Account, logf) -> bool:
+        """Fill all fields and tick the terms box in one script call; False if any of it did not stick"""
+        fields = [[selectors, getattr(account, value)] for selectors, value in _FILL_FIELDS]
+        try:
+            result = driver.execute_script(_FILL_FORM_SCRIPT, [fields, _FILL_CHECKBOXES])
+        except WebDriverException:
+            return False
+        if result['values'] != [value for _, value in fields] or not result['checked']:
+            return False
         
+        for step in _FORM_STEPS:
+            logf(step.message, account.username)
+        return True
+    
+    def _wait_for_registration_form(self, driver):
+        """Wait for registration form to appear"""
         try:
-            element = WebDriverWait(self.selenium_driver, 5).until(
-                EC.element_to_be_clickable(submit_selector)
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located(_REGISTRATION_FORM_SELECTOR)
             )
-            element.click()
-        except Exception as e:
-            raise Exception(f"Failed to click registration button: {str(e)}")
+        except TimeoutException:
+            pass
     
-    def _verify_registration_success(self, account: Account):
-        """Verify registration success by checking for logout link"""
-        logout_selector = (By.XPATH, '/html/body/div[1]/div/span[2]/a[2]')
+    def _verify_registration_success(self, driver, account: Account, shown_before=()) -> bool:
+        """Verify registration success by checking for logout link, marking the account"""
+        # A failure message that was not on the page before submitting ends the wait
+        # at once instead of after the full timeout
+        reported = []
         
-        try:
-            # Wait for registration processing (up to 30 seconds)
-            element = WebDriverWait(self.selenium_driver, 30).until(
-                EC.presence_of_element_located(logout_selector)
-            )
-            
-            # Check if logout link contains [退出] text
-            logout_text = element.text
-            
-            if logout_text and '[退出]' in logout_text:
-                # Registration successful
-                success_note = tr("Account registered successfully and automatically logged in")
-                account.mark_success(success_note)
-                self._log(tr("SUCCESS: %1 registered and logged in").replace("%1", account.username))
-            else:
-                raise Exception(f"Logout link found but doesn't contain [退出]: {logout_text}")
-                
-        except Exception as e:
+        def failure_reported() -> bool:
+            reported.extend(m for m in self._present_texts(driver, _FAILURE_MESSAGES) if m not in shown_before)
+            return bool(reported)
+        
+        # Wait for registration processing (up to 30 seconds); both locators only
+        # match the logged-in logout link, so no text read follows. A timeout is an
+        # ordinary outcome here and is reported without raising.
+        if self._wait_for_displayed(driver, _LOGOUT_LINK_SELECTORS, 30, give_up=failure_reported) is None:
             # Registration might have failed or requires verification
-            error_msg = f"Registration verification failed: {str(e)}"
+            if reported:
+                error_msg = f"Registration verification failed: page reported '{reported[0]}'"
+            else:
+                error_msg = "Registration verification failed: logout link did not appear"
             account.mark_failed(error_msg)
-            self._log(tr("FAILED: %1 - %2").replace("%1", account.username).replace("%2", error_msg))
\ No newline at end of file
+            self._logf("FAILED: %1 - %2", account.username, error_msg)
+            return False
+        
+        # Registration successful
+        success_note = tr("Account registered successfully and automatically logged in")
+        account.mark_success(success_note)
+        self._logf("SUCCESS: %1 registered and logged in", account.username)
+        return True
@@ -5,15 +5,49 @@ Simplified State Machine Implementation using transitions framework
 
 import asyncio
 import logging
-from typing import Optional, Callable
+from contextlib import asynccontextmanager
+from typing import Callable
 from transitions.extensions.asyncio import AsyncMachine
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from ...models.account import Account, AccountStatus
+from ..callbacks import noop_callback
 from .captcha_handler import CaptchaHandler
-from .form_helpers import FormSelectors
+from .form_helpers import FormSelectors, fill_form, selector_cache, union_locator
 from .result_detector import RegistrationResultDetector
 
+# 页面内容检测关键字
+CAPTCHA_INDICATORS = ("验证码", "captcha", "滑动验证")
+CAPTCHA_PENDING_INDICATORS = CAPTCHA_INDICATORS + ("验证失败", "重新验证")
+ALREADY_REGISTERED_INDICATORS = ("该账号已经注册", "用户名已存在", "账号已被占用", "立即登录")
+SUCCESS_INDICATORS = ("退出", "logout", "个人中心", "用户中心")
+
+HOMEPAGE_URL = 'https://wan.360.cn/'
+
+# 提交后判断结果所依据的全部关键字
+RESULT_INDICATORS = CAPTCHA_INDICATORS + ALREADY_REGISTERED_INDICATORS + SUCCESS_INDICATORS
+
+# 验证码监控期间检测的全部关键字
+MONITOR_INDICATORS = CAPTCHA_PENDING_INDICATORS + ALREADY_REGISTERED_INDICATORS + SUCCESS_INDICATORS
+
+# 返回当前页面 HTML 中已出现的关键字
+PRESENT_INDICATORS_JS = """indicators => {
+    const html = document.documentElement.outerHTML;
+    return indicators.filter(i => html.includes(i));
+}"""
+
+# 提交前不存在的关键字出现时返回 true（即服务器已有响应）
+NEW_INDICATOR_JS = """([indicators, before]) => {
+    const html = document.documentElement.outerHTML;
+    return indicators.some(i => !before.includes(i) && html.includes(i));
+}"""
+
+# 等待提交结果出现的上限（毫秒，与原先固定等待的 3s + 2s 相同）
+RESULT_WAIT_TIMEOUT = 5000
+
+# 一次页面内求值同时读取链接的 href 和 target
+LINK_ATTRIBUTES_JS = "el => [el.getAttribute('href'), el.getAttribute('target')]"
+
 
 class RegistrationMachine:
     """
@@ -21,6 +55,14 @@ class RegistrationMachine:
     Registration State Machine using transitions framework
     """
     
+    # 出错时可重新进入的状态及其重试触发器（提交按钮已点击后不再重试提交）
+    RETRY_TRIGGERS = {
+        'navigating': 'retry_navigation',
+        'opening_form': 'retry_form',
+        'filling_form': 'retry_filling',
+        'submitting': 'retry_submit',
+    }
+    
     # 定义所有状态
     states = [
         'initializing',
@@ -50,14 +92,20 @@ class RegistrationMachine:
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         # 回调函数
-        self.on_log: Optional[Callable[[str], None]] = None
-        self.on_captcha_detected: Optional[Callable[[Account, str], None]] = None
-        self.on_success: Optional[Callable[[Account, str], None]] = None
-        self.on_failed: Optional[Callable[[Account, str], None]] = None
+        self.on_log: Callable[[str], None] = noop_callback
+        self.on_captcha_detected: Callable[[Account, str], None] = noop_callback
+        self.on_success: Callable[[Account, str], None] = noop_callback
+        self.on_failed: Callable[[Account, str], None] = noop_callback
         
         # 验证码处理器
         self.captcha_handler = CaptchaHandler(page, account)
         
+        # 提交前页面中已存在的结果关键字
+        self._indicators_before_submit: list[str] = []
+        
+        # 提交按钮是否已点击；点击后出错不重试，避免重复提交同一账号
+        self._submit_clicked = False
+        
         # 重试计数
         self.retry_count = 0
         self.max_retries = 3
@@ -115,8 +163,7 @@ class RegistrationMachine:
     def _log(self, message: str):
         """统一日志方法"""
         self.logger.debug(message)
-        if self.on_log:
-            self.on_log(message)
+        self.on_log(message)
     
     def is_terminal(self) -> bool:
         """检查是否到达终态"""
@@ -143,42 +190,37 @@ class RegistrationMachine:
             # 处理最终结果
             if self.state == 'success':
                 self.account.mark_success("注册成功")
-                if self.on_success:
-                    self.on_success(self.account, "注册成功")
+                self.on_success(self.account, "注册成功")
                 return True
             else:
                 self.account.mark_failed("注册失败")
-                if self.on_failed:
-                    self.on_failed(self.account, "注册失败")
+                self.on_failed(self.account, "注册失败")
                 return False
                 
         except Exception as e:
             self._log(f"❌ 状态机运行出错: {e}")
             self.account.mark_failed(f"状态机错误: {str(e)}")
-            if self.on_failed:
-                self.on_failed(self.account, str(e))
+            self.on_failed(self.account, str(e))
             return False
     
     # =================== 状态处理方法 ===================
     
     async def on_enter_navigating(self, event):
         """进入导航状态"""
-        try:
+        async with self._step("导航失败"):
             self._log("📍 开始导航到注册页面")
             self._log(f"   导航前URL: {self.page.url}")
             
-            await self.page.goto('https://wan.360.cn/', 
-                                wait_until='domcontentloaded', 
-                                timeout=20000)
-            
-            # 等待页面稳定
-            await asyncio.sleep(2)
+            # 只等待响应提交，随后直接等待注册按钮可见（广告和统计脚本不影响交互）
+            await self.page.goto(HOMEPAGE_URL, wait_until='commit', timeout=30000)
+            try:
+                await selector_cache.locate(self.page, FormSelectors.REGISTRATION_BUTTONS, 15000)
+            except PlaywrightTimeoutError:
+                raise Exception("首页注册按钮未出现")
             
-            # 验证导航结果
+            # 验证导航结果（page.url 为本地属性，无需额外往返）
             current_url = self.page.url
-            page_title = await self.page.title()
             self._log(f"   导航后URL: {current_url}")
-            self._log(f"   页面标题: {page_title}")
             
             if current_url == "about:blank":
                 raise Exception("导航失败，页面仍为 about:blank")
@@ -188,188 +230,140 @@ class RegistrationMachine:
             
             # 自动转换到下一状态
             await self.navigation_complete()
-            
-        except Exception as e:
-            self._log(f"❌ 导航失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_homepage_ready(self, event):
         """进入首页准备状态"""
-        try:
+        async with self._step("首页准备失败"):
             self._log("🏠 首页准备就绪")
             
-            # 等待页面JavaScript加载
-            await asyncio.sleep(2)
-            
+            # 导航阶段已等到注册按钮可见，无需再固定等待
             # 自动点击注册按钮
             await self.click_register()
-            
-        except Exception as e:
-            self._log(f"❌ 首页准备失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_opening_form(self, event):
         """进入打开表单状态"""
-        try:
+        async with self._step("打开表单失败"):
             self._log("📝 点击注册按钮")
             
-            # 寻找并点击注册按钮
-            button_clicked = False
-            for selector in FormSelectors.REGISTRATION_BUTTONS:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    elements = await self.page.locator(selector).all()
-                    
-                    for element in elements:
-                        if await element.is_visible():
-                            # 处理可能的新标签页
-                            href = await element.get_attribute('href')
-                            target = await element.get_attribute('target')
-                            
-                            if target == '_blank' or (href and 'reg' in href):
-                                if href:
-                                    self._log(f"   直接导航到: {href}")
-                                    await self.page.goto(href)
-                                else:
-                                    await element.evaluate('el => el.removeAttribute("target")')
-                                    await element.click()
-                            else:
-                                await element.click()
-                            
-                            button_clicked = True
-                            break
-                    
-                    if button_clicked:
-                        break
-                        
-                except PlaywrightTimeoutError:
-                    continue
-            
-            if not button_clicked:
+            # 寻找并点击注册按钮（优先使用已命中的选择器）
+            try:
+                button = await selector_cache.locate(self.page, FormSelectors.REGISTRATION_BUTTONS, 10000)
+            except PlaywrightTimeoutError:
                 raise Exception("未找到注册按钮")
             
-            # 等待表单出现
-            await asyncio.sleep(2)
+            # 处理可能的新标签页
+            href, target = await button.evaluate(LINK_ATTRIBUTES_JS)
+            
+            if target == '_blank' or (href and 'reg' in href):
+                if href:
+                    self._log(f"   直接导航到: {href}")
+                    # 表单可见性等待在后面进行，这里无需等待全部资源加载
+                    await self.page.goto(href, wait_until='domcontentloaded', timeout=20000)
+                else:
+                    await button.evaluate('el => el.removeAttribute("target")')
+                    await button.click()
+            else:
+                await button.click()
             
-            # 检查表单是否出现
+            # 检查表单是否出现（表单可见即返回，无需先固定等待）
             form_found = False
-            for selector in FormSelectors.REGISTRATION_FORMS:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    form_found = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
+            try:
+                await union_locator(self.page, FormSelectors.REGISTRATION_FORMS_UNION).wait_for(
+                    state='visible', timeout=10000
+                )
+                form_found = True
+            except PlaywrightTimeoutError:
+                pass
             
             if form_found:
                 await self.form_appeared()
             else:
                 # 可能直接跳转到了注册页面
                 await self.form_appeared()
-                
-        except Exception as e:
-            self._log(f"❌ 打开表单失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_form_ready(self, event):
         """进入表单准备状态"""
-        try:
+        async with self._step("表单准备失败"):
             self._log("✏️  表单准备就绪，开始填写")
             await self.start_filling()
-            
-        except Exception as e:
-            self._log(f"❌ 表单准备失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_filling_form(self, event):
         """进入填写表单状态"""
-        try:
+        async with self._step("表单填写失败"):
             self._log("📋 填写注册表单")
             
             # 验证输入参数
             self._validate_input_constraints()
             
-            # 填写用户名（不允许截断）
-            await self._fill_field(
-                FormSelectors.USERNAME_FIELDS,
-                self.account.username,
-                "用户名"
+            fields = (
+                (FormSelectors.USERNAME_FIELDS, self.account.username, "用户名"),
+                (FormSelectors.PASSWORD_FIELDS, self.account.password, "密码"),
+                (FormSelectors.CONFIRM_PASSWORD_FIELDS, self.account.password, "确认密码"),
             )
             
-            # 填写密码
-            await self._fill_field(
-                FormSelectors.PASSWORD_FIELDS,
-                self.account.password,
-                "密码"
+            # 一次页面内求值填写全部字段并勾选条款
+            values, checked = await fill_form(
+                self.page,
+                [(selectors, value) for selectors, value, _ in fields],
+                FormSelectors.TERMS_CHECKBOXES
             )
             
-            # 填写确认密码
-            await self._fill_field(
-                FormSelectors.CONFIRM_PASSWORD_FIELDS,
-                self.account.password,
-                "确认密码"
-            )
+            # 未找到或值被页面改写的字段逐个重新填写
+            for (selectors, value, field_name), actual_value in zip(fields, values):
+                if actual_value == value:
+                    self._log(f"   ✅ {field_name}填写成功")
+                else:
+                    await self._fill_field(selectors, value, field_name)
             
-            # 勾选条款
-            await self._check_terms_checkbox()
+            if not checked:
+                await self._check_terms_checkbox()
             
             self._log("✅ 表单填写完成")
             await self.form_filled()
-            
-        except Exception as e:
-            self._log(f"❌ 表单填写失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_submitting(self, event):
         """进入提交状态"""
-        try:
+        async with self._step("表单提交失败"):
             self._log("🚀 提交注册表单")
             
             # 寻找并点击提交按钮
-            submit_clicked = False
-            for selector in FormSelectors.SUBMIT_BUTTONS:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    elements = await self.page.locator(selector).all()
-                    
-                    for element in elements:
-                        if await element.is_visible():
-                            await element.click()
-                            submit_clicked = True
-                            break
-                    
-                    if submit_clicked:
-                        break
-                        
-                except PlaywrightTimeoutError:
-                    continue
-            
-            if not submit_clicked:
+            try:
+                submit_button = await selector_cache.locate(self.page, FormSelectors.SUBMIT_BUTTONS, 10000)
+            except PlaywrightTimeoutError:
                 raise Exception("未找到提交按钮")
             
-            # 等待提交处理
-            await asyncio.sleep(3)
+            # 记录提交前已存在的关键字，以便只等待新出现的结果
+            self._indicators_before_submit = await self.page.evaluate(
+                PRESENT_INDICATORS_JS, list(RESULT_INDICATORS)
+            )
             
-            await self.form_submitted()
+            self._submit_clicked = True
+            await submit_button.click()
             
-        except Exception as e:
-            self._log(f"❌ 表单提交失败: {e}")
-            await self._handle_error(e)
+            await self.form_submitted()
     
     async def on_enter_waiting_result(self, event):
         """进入等待结果状态"""
-        try:
+        async with self._step("等待结果失败"):
             self._log("⏳ 等待注册结果")
             
-            # 等待页面响应
-            await asyncio.sleep(2)
+            # 等待页面出现新的结果关键字，由 MutationObserver 在 DOM 变化时
+            # 触发检测，而不是定时轮询
+            try:
+                await self.page.wait_for_function(
+                    NEW_INDICATOR_JS,
+                    arg=[list(RESULT_INDICATORS), self._indicators_before_submit],
+                    polling='mutation',
+                    timeout=RESULT_WAIT_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                self._log("   未检测到新的结果标识，按当前页面判断")
             
-            # 检查是否有验证码
-            page_content = await self.page.content()
+            # 在页面内检测关键字，只传回命中的关键字而不是整页 HTML
+            present = set(await self.page.evaluate(PRESENT_INDICATORS_JS, list(RESULT_INDICATORS)))
             
             # 检测验证码
-            captcha_indicators = ["验证码", "captcha", "滑动验证"]
-            if any(indicator in page_content for indicator in captcha_indicators):
+            if not present.isdisjoint(CAPTCHA_INDICATORS):
                 self._log("🔍 检测到验证码")
                 await self.captcha_detected()
                 return
@@ -378,16 +372,14 @@ class RegistrationMachine:
             self._log("✅ 未检测到验证码，直接检测结果")
             
             # 检查账号已注册
-            error_indicators = ["该账号已经注册", "用户名已存在", "账号已被占用", "立即登录"]
-            if any(indicator in page_content for indicator in error_indicators):
+            if not present.isdisjoint(ALREADY_REGISTERED_INDICATORS):
                 self._log("⚠️  检测到账号已注册")
                 self.account.mark_failed("账号已注册")
                 await self.no_captcha_failed()
                 return
             
             # 检查注册成功
-            success_indicators = ["退出", "logout", "个人中心", "用户中心"]
-            if any(indicator in page_content for indicator in success_indicators):
+            if not present.isdisjoint(SUCCESS_INDICATORS):
                 self._log("🎉 检测到注册成功")
                 self.account.mark_success("注册成功")
                 await self.no_captcha_success()
@@ -397,10 +389,6 @@ class RegistrationMachine:
             self._log("⚠️  注册结果不明确")
             self.account.mark_failed("注册结果不明确")
             await self.no_captcha_failed()
-                
-        except Exception as e:
-            self._log(f"❌ 等待结果失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_captcha_monitoring(self, event):
         """进入验证码监控状态"""
@@ -408,8 +396,7 @@ class RegistrationMachine:
         self._log("   请手动完成验证码，系统每5秒检测一次状态")
         
         # 通知UI验证码被检测到
-        if self.on_captcha_detected:
-            self.on_captcha_detected(self.account, "检测到验证码，需要手动处理")
+        self.on_captcha_detected(self.account, "检测到验证码，需要手动处理")
         
         # 启动监控循环
         asyncio.create_task(self._monitor_captcha_status())
@@ -444,26 +431,18 @@ class RegistrationMachine:
                     await self.registration_failed()
                     return
                 
-                # 获取当前页面内容
-                page_content = await self.page.content()
+                # 在页面内检测关键字，只传回命中的关键字
+                present = set(await self.page.evaluate(PRESENT_INDICATORS_JS, list(MONITOR_INDICATORS)))
                 
                 # Step 2: 检查账号已注册错误（优先级最高）
-                error_indicators = [
-                    "该账号已经注册", 
-                    "用户名已存在",
-                    "账号已被占用",
-                    "立即登录"
-                ]
-                
-                if any(indicator in page_content for indicator in error_indicators):
+                if not present.isdisjoint(ALREADY_REGISTERED_INDICATORS):
                     self._log("⚠️  检测到账号已注册")
                     self.account.mark_failed("账号已注册")
                     await self.registration_failed()
                     return
                 
                 # Step 3: 检查验证码是否还存在
-                captcha_indicators = ["验证码", "captcha", "滑动验证", "验证失败", "重新验证"]
-                captcha_still_present = any(indicator in page_content for indicator in captcha_indicators)
+                captcha_still_present = not present.isdisjoint(CAPTCHA_PENDING_INDICATORS)
                 
                 if captcha_still_present:
                     # 验证码仍存在，继续等待
@@ -472,9 +451,7 @@ class RegistrationMachine:
                 
                 # Step 4: 验证码已消失，检查注册成功标识
                 self._log("✅ 验证码已消失，检查注册结果")
-                success_indicators = ["退出", "logout", "个人中心", "用户中心"]
-                
-                if any(indicator in page_content for indicator in success_indicators):
+                if not present.isdisjoint(SUCCESS_INDICATORS):
                     self._log("🎉 检测到注册成功标识")
                     self.account.mark_success("注册成功")
                     await self.registration_success()
@@ -499,15 +476,17 @@ class RegistrationMachine:
     
     async def on_enter_verifying_success(self, event):
         """进入验证成功状态"""
-        try:
+        async with self._step("验证结果失败"):
             self._log("🔍 验证注册结果")
             
-            # 获取页面内容并检测结果
-            page_content = await self.page.content()
+            # 在页面内收集结果关键字，而不是传回整页 HTML
+            found = await self.page.evaluate(
+                PRESENT_INDICATORS_JS, list(RegistrationResultDetector.ALL_INDICATORS)
+            )
             
             try:
-                success, message = RegistrationResultDetector.detect_registration_result(
-                    page_content, self.account
+                success, message = RegistrationResultDetector.detect_from_indicators(
+                    set(found), self.account
                 )
                 
                 if success:
@@ -520,10 +499,6 @@ class RegistrationMachine:
             except Exception as e:
                 self._log(f"⚠️  结果检测异常: {e}")
                 await self.registration_failed()
-                
-        except Exception as e:
-            self._log(f"❌ 验证结果失败: {e}")
-            await self._handle_error(e)
     
     async def on_enter_success(self, event):
         """进入成功状态"""
@@ -537,76 +512,59 @@ class RegistrationMachine:
     
     async def _fill_field(self, selectors, value, field_name, allow_truncation=False):
         """填写表单字段"""
-        filled = False
-        final_filled_value = None
+        try:
+            element = await selector_cache.locate(self.page, selectors, 10000)
+        except PlaywrightTimeoutError:
+            raise Exception(f"无法填写{field_name}字段")
         
-        for selector in selectors:
-            try:
-                await self.page.wait_for_selector(selector, timeout=3000)
-                elements = await self.page.locator(selector).all()
+        # 清空字段
+        await element.clear()
+        
+        # 记录输入前状态
+        self._log(f"   📝 准备填写{field_name}: '{value}' (长度: {len(value)})")
+        
+        # 使用type方法逐字符输入，避免被JS截断
+        await element.type(value, delay=50)  # 每个字符间隔50ms
+        
+        # 等待可能的JS处理
+        await asyncio.sleep(0.5)
+        
+        # 验证实际填入的值
+        actual_value = await element.input_value()
+        self._log(f"   🔍 实际填入{field_name}: '{actual_value}' (长度: {len(actual_value)})")
+        
+        # 如果值不匹配
+        if actual_value != value:
+            if allow_truncation and len(actual_value) < len(value) and value.startswith(actual_value):
+                # 允许截断且实际值是期望值的前缀
+                self._log(f"   ⚠️  {field_name}被页面截断，但允许截断：'{actual_value}'")
+                final_filled_value = actual_value
+            else:
+                # 尝试重新填写
+                self._log(f"   ⚠️  {field_name}值不匹配，尝试重新填写")
+                await element.clear()
+                await asyncio.sleep(0.2)
+                await element.fill(value)  # 使用fill方法再试一次
+                await asyncio.sleep(0.3)
                 
-                for element in elements:
-                    if await element.is_visible():
-                        # 清空字段
-                        await element.clear()
-                        
-                        # 记录输入前状态
-                        self._log(f"   📝 准备填写{field_name}: '{value}' (长度: {len(value)})")
-                        
-                        # 使用type方法逐字符输入，避免被JS截断
-                        await element.type(value, delay=50)  # 每个字符间隔50ms
-                        
-                        # 等待可能的JS处理
-                        await asyncio.sleep(0.5)
-                        
-                        # 验证实际填入的值
-                        actual_value = await element.input_value()
-                        self._log(f"   🔍 实际填入{field_name}: '{actual_value}' (长度: {len(actual_value)})")
-                        
-                        # 如果值不匹配
-                        if actual_value != value:
-                            if allow_truncation and len(actual_value) < len(value) and value.startswith(actual_value):
-                                # 允许截断且实际值是期望值的前缀
-                                self._log(f"   ⚠️  {field_name}被页面截断，但允许截断：'{actual_value}'")
-                                final_filled_value = actual_value
-                            else:
-                                # 尝试重新填写
-                                self._log(f"   ⚠️  {field_name}值不匹配，尝试重新填写")
-                                await element.clear()
-                                await asyncio.sleep(0.2)
-                                await element.fill(value)  # 使用fill方法再试一次
-                                await asyncio.sleep(0.3)
-                                
-                                # 再次验证
-                                final_value = await element.input_value()
-                                self._log(f"   🔍 重新填写后{field_name}: '{final_value}' (长度: {len(final_value)})")
-                                
-                                if final_value != value:
-                                    if allow_truncation and len(final_value) < len(value) and value.startswith(final_value):
-                                        # 重新填写后仍被截断，但允许截断
-                                        self._log(f"   ⚠️  {field_name}重填后仍被截断，但允许截断：'{final_value}'")
-                                        final_filled_value = final_value
-                                    else:
-                                        self._log(f"   ❌ {field_name}填写失败：期望 '{value}', 实际 '{final_value}'")
-                                        raise Exception(f"{field_name}填写不正确")
-                                else:
-                                    final_filled_value = final_value
-                        else:
-                            final_filled_value = actual_value
-                        
-                        filled = True
-                        break
+                # 再次验证
+                final_value = await element.input_value()
+                self._log(f"   🔍 重新填写后{field_name}: '{final_value}' (长度: {len(final_value)})")
                 
-                if filled:
-                    self._log(f"   ✅ {field_name}填写成功")
-                    break
-                    
-            except PlaywrightTimeoutError:
-                continue
-        
-        if not filled:
-            raise Exception(f"无法填写{field_name}字段")
+                if final_value != value:
+                    if allow_truncation and len(final_value) < len(value) and value.startswith(final_value):
+                        # 重新填写后仍被截断，但允许截断
+                        self._log(f"   ⚠️  {field_name}重填后仍被截断，但允许截断：'{final_value}'")
+                        final_filled_value = final_value
+                    else:
+                        self._log(f"   ❌ {field_name}填写失败：期望 '{value}', 实际 '{final_value}'")
+                        raise Exception(f"{field_name}填写不正确")
+                else:
+                    final_filled_value = final_value
+        else:
+            final_filled_value = actual_value
         
+        self._log(f"   ✅ {field_name}填写成功")
         return final_filled_value
     
     def _validate_input_constraints(self):
@@ -640,27 +598,35 @@ class RegistrationMachine:
     
     async def _check_terms_checkbox(self):
         """勾选用户条款"""
-        for selector in FormSelectors.TERMS_CHECKBOXES:
-            try:
-                await self.page.wait_for_selector(selector, timeout=3000)
-                elements = await self.page.locator(selector).all()
-                
-                for element in elements:
-                    if await element.is_visible() and not await element.is_checked():
-                        await element.check()
-                        self._log("   ✅ 用户条款勾选成功")
-                        return
-                        
-            except PlaywrightTimeoutError:
-                continue
+        try:
+            checkbox = await selector_cache.locate(self.page, FormSelectors.TERMS_CHECKBOXES, 3000)
+        except PlaywrightTimeoutError:
+            return
+        
+        if not await checkbox.is_checked():
+            await checkbox.check()
+            self._log("   ✅ 用户条款勾选成功")
+    
+    @asynccontextmanager
+    async def _step(self, failure: str):
+        """运行状态处理逻辑，出错时记录日志并重试或转为失败"""
+        try:
+            yield
+        except Exception as e:
+            self._log(f"❌ {failure}: {e}")
+            await self._handle_error(e)
     
     async def _handle_error(self, error):
         """处理错误"""
         self.retry_count += 1
         
-        if self.retry_count <= self.max_retries:
+        retry_trigger = self.RETRY_TRIGGERS.get(self.state)
+        if self.state == 'submitting' and self._submit_clicked:
+            # 注册请求可能已发出，重新提交会重复注册
+            retry_trigger = None
+        if retry_trigger and self.retry_count <= self.max_retries:
             self._log(f"⚠️  第{self.retry_count}次重试")
-            # 可以根据需要实现重试逻辑
+            await self.trigger(retry_trigger)
         else:
             self._log("❌ 超过最大重试次数，转为失败状态")
             await self.fail()
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""
+Shared callback helpers for the service layer
+"""
+
+
+def noop_callback(*args, **kwargs):
+    """Default callback that ignores its arguments, so callers need no None checks"""
@@ -8,10 +8,11 @@ Provides intelligent captcha verification with 5-second polling and 60-second ti
 import asyncio
 import time
 import logging
-from typing import Callable, Optional
+from typing import Callable
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from ..models.account import Account, AccountStatus
-from ..translation_manager import tr
+from ..translation_manager import tr, trf
+from .callbacks import noop_callback
 
 try:
     from PySide6.QtCore import QObject, QTimer, Signal
@@ -45,11 +46,11 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
         # Logging setup
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
-        # Callback functions for ViewModel communication
-        self.on_captcha_detected: Optional[Callable[[Account, str], None]] = None
-        self.on_captcha_resolved: Optional[Callable[[Account, str], None]] = None
-        self.on_captcha_timeout: Optional[Callable[[Account, str], None]] = None
-        self.on_log_message: Optional[Callable[[str], None]] = None
+        # Callback functions for ViewModel communication (no-ops until set)
+        self.on_captcha_detected: Callable[[Account, str], None] = noop_callback
+        self.on_captcha_resolved: Callable[[Account, str], None] = noop_callback
+        self.on_captcha_timeout: Callable[[Account, str], None] = noop_callback
+        self.on_log_message: Callable[[str], None] = noop_callback
         
         # Active monitoring timers
         self.active_timers: dict[int, QTimer] = {}
@@ -64,10 +65,10 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
                      on_captcha_timeout: Callable[[Account, str], None] = None,
                      on_log_message: Callable[[str], None] = None):
         """Set callback functions for ViewModel communication (MVVM pattern)"""
-        self.on_captcha_detected = on_captcha_detected
-        self.on_captcha_resolved = on_captcha_resolved
-        self.on_captcha_timeout = on_captcha_timeout
-        self.on_log_message = on_log_message
+        self.on_captcha_detected = on_captcha_detected or noop_callback
+        self.on_captcha_resolved = on_captcha_resolved or noop_callback
+        self.on_captcha_timeout = on_captcha_timeout or noop_callback
+        self.on_log_message = on_log_message or noop_callback
     
     def detect_captcha_in_content(self, page_content: str) -> tuple[bool, str]:
         """
@@ -185,14 +186,13 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
         account.status = AccountStatus.CAPTCHA_PENDING
         
         # Notify ViewModel through callback
-        if self.on_captcha_detected:
-            self.on_captcha_detected(account, "Started captcha monitoring")
+        self.on_captcha_detected(account, "Started captcha monitoring")
         
         # Emit Qt signal if available
         if hasattr(self, 'captcha_detected'):
             self.captcha_detected.emit(account, "Started captcha monitoring")
         
-        self._log_message(tr("🔍 Starting captcha monitoring for %1 - checking every 5 seconds").replace("%1", account.username))
+        self._log_message(trf("🔍 Starting captcha monitoring for %1 - checking every 5 seconds", account.username))
         
         # Create and start QTimer for 5-second polling
         timer = QTimer()
@@ -209,7 +209,7 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
             
             # Check if account status changed (external update)
             if account.status != AccountStatus.CAPTCHA_PENDING:
-                self._log_message(tr("✅ Account status changed - stopping monitoring for %1").replace("%1", account.username))
+                self._log_message(trf("✅ Account status changed - stopping monitoring for %1", account.username))
                 self._cleanup_timer(account.id)
                 return
             
@@ -225,7 +225,7 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
         timer.timeout.connect(check_captcha_status)
         timer.start(self.polling_interval * 1000)  # Convert to milliseconds
         
-        self._log_message(tr("✅ Captcha monitoring started for %1 (polling every %2 seconds)").replace("%1", account.username).replace("%2", str(self.polling_interval)))
+        self._log_message(trf("✅ Captcha monitoring started for %1 (polling every %2 seconds)", account.username, self.polling_interval))
     
     def manual_check(self, account: Account, page: Page) -> bool:
         """
@@ -238,7 +238,7 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
         Returns:
             bool: True if captcha completed, False otherwise
         """
-        self._log_message(tr("🔍 Manual captcha check for %1").replace("%1", account.username))
+        self._log_message(trf("🔍 Manual captcha check for %1", account.username))
         
         try:
             # Get page content synchronously
@@ -251,7 +251,7 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
                 self._handle_success(account, message)
                 return True
             else:
-                self._log_message(tr("ℹ️ Manual check result: %1").replace("%1", message))
+                self._log_message(trf("ℹ️ Manual check result: %1", message))
                 return False
                 
         except Exception as e:
@@ -294,7 +294,7 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
                             self._handle_success(account, message, timer)
                         else:
                             # Continue monitoring
-                            self._log_message(tr("⏳ Still waiting for captcha completion: %1").replace("%1", message))
+                            self._log_message(trf("⏳ Still waiting for captcha completion: %1", message))
                     
                     finally:
                         loop.close()
@@ -327,14 +327,13 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
             self._cleanup_timer(account.id)
         
         # Notify ViewModel through callback
-        if self.on_captcha_resolved:
-            self.on_captcha_resolved(account, message)
+        self.on_captcha_resolved(account, message)
         
         # Emit Qt signal if available
         if hasattr(self, 'captcha_resolved'):
             self.captcha_resolved.emit(account, message)
         
-        self._log_message(tr("🎉 SUCCESS: %1 - Captcha completed!").replace("%1", account.username))
+        self._log_message(trf("🎉 SUCCESS: %1 - Captcha completed!", account.username))
     
     def _handle_timeout(self, account: Account, timer: QTimer):
         """Handle captcha monitoring timeout"""
@@ -344,14 +343,13 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
         self._cleanup_timer_instance(timer)
         
         # Notify ViewModel through callback
-        if self.on_captcha_timeout:
-            self.on_captcha_timeout(account, timeout_message)
+        self.on_captcha_timeout(account, timeout_message)
         
         # Emit Qt signal if available
         if hasattr(self, 'captcha_timeout'):
             self.captcha_timeout.emit(account, timeout_message)
         
-        self._log_message(tr("⏰ TIMEOUT: Captcha not resolved for %1 after %2 seconds").replace("%1", account.username).replace("%2", str(self.timeout_duration)))
+        self._log_message(trf("⏰ TIMEOUT: Captcha not resolved for %1 after %2 seconds", account.username, self.timeout_duration))
     
     def _handle_page_closed(self, account: Account, timer: QTimer):
         """Handle page closed during monitoring"""
@@ -360,7 +358,7 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
         
         self._cleanup_timer_instance(timer)
         
-        self._log_message(tr("🚪 Browser closed for %1 - stopping monitoring").replace("%1", account.username))
+        self._log_message(trf("🚪 Browser closed for %1 - stopping monitoring", account.username))
     
     def _cleanup_timer(self, account_id: int):
         """Clean up timer for specific account"""
@@ -381,11 +379,9 @@ class CaptchaService(QObject if PYSIDE6_AVAILABLE else object):
     def _log_message(self, message: str):
         """Log message through callback and logger"""
         self.logger.info(message)
-        if self.on_log_message:
-            self.on_log_message(message)
+        self.on_log_message(message)
     
     def _log_error(self, error: str):
         """Log error through callback and logger"""
         self.logger.error(error)
-        if self.on_log_message:
-            self.on_log_message(tr("ERROR: %1").replace("%1", error))
\ No newline at end of file
+        self.on_log_message(trf("ERROR: %1", error))
\ No newline at end of file
@@ -5,6 +5,8 @@ Handles language switching and translation loading.
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from PySide6.QtCore import QObject, Signal, QTranslator, QCoreApplication, QLocale, QSettings
@@ -96,6 +98,7 @@ class TranslationManager(QObject):
         if self.current_translator:
             self.app.removeTranslator(self.current_translator)
             self.current_translator = None
+            clear_translation_cache()
         
         # Don't load translator for English (source language)
         if locale == 'en-US':
@@ -141,6 +144,7 @@ class TranslationManager(QObject):
         if translator.load(str(translation_file)):
             self.app.installTranslator(translator)
             self.current_translator = translator
+            clear_translation_cache()
             self.current_locale = locale
             self.save_language(locale)
             
@@ -180,10 +184,24 @@ def init_translation_manager(app: QApplication) -> TranslationManager:
     return _translation_manager_instance
 
 
+@lru_cache(maxsize=512)
+def _translate(context: str, text: str) -> str:
+    """Look up a translation through Qt (memoized, see clear_translation_cache)"""
+    return QCoreApplication.translate(context, text)
+
+
+def clear_translation_cache() -> None:
+    """Drop memoized translations; must be called whenever the installed translator changes"""
+    _translate.cache_clear()
+
+
 def tr(text: str, context: str = "BatchCreatorMainWindow") -> str:
     """
     Convenient translation function.
     
+    Translations are memoized per (context, text) since the same log templates
+    are looked up many times per account; the cache is cleared on language switch.
+    
     Args:
         text: Text to translate
         context: Translation context (default: BatchCreatorMainWindow)
@@ -191,4 +209,43 @@ def tr(text: str, context: str = "BatchCreatorMainWindow") -> str:
     Returns:
         Translated text
     """
-    return QCoreApplication.translate(context, text)
\ No newline at end of file
+    return _translate(context, text)
+
+
+# Qt-style %1..%9 placeholders in a translated template
+_PLACEHOLDER = re.compile(r"%([1-9])")
+
+
+@lru_cache(maxsize=512)
+def _format_template(translated: str) -> str:
+    """Convert a translated %1..%9 template into a str.format_map template (memoized)"""
+    escaped = translated.replace("{", "{{").replace("}", "}}")
+    return _PLACEHOLDER.sub(lambda m: "{p%s}" % m.group(1), escaped)
+
+
+class _Placeholders(dict):
+    """Values for p1..p9; a placeholder without a value stays as %N text"""
+    
+    def __missing__(self, key: str) -> str:
+        return "%" + key[1:]
+
+
+def trf(text: str, *args, context: str = "BatchCreatorMainWindow") -> str:
+    """
+    Translate a template and fill its %1, %2, ... placeholders in one pass.
+    
+    Equivalent to tr(text).replace("%1", str(args[0])).replace("%2", ...), but the
+    template is converted once and then filled by str.format_map. Placeholders
+    without a matching argument are left as they are, so a translation with an
+    extra %N never raises.
+    
+    Args:
+        text: Text to translate, using Qt-style %1..%9 placeholders
+        *args: Values for %1, %2, ...
+        context: Translation context (default: BatchCreatorMainWindow)
+        
+    Returns:
+        Translated text with placeholders filled
+    """
+    values = _Placeholders(("p%d" % i, arg) for i, arg in enumerate(args, 1))
+    return _format_template(tr(text, context)).format_map(values)
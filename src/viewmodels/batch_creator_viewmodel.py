@@ -2,8 +2,9 @@
 Main ViewModel for the Batch Account Creator application
 """
 
+import threading
 from typing import List, Callable, Optional
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QObject, QTimer, Signal
 from PySide6.QtWidgets import QApplication
 
 from ..models.account import Account, AccountStatus
@@ -11,7 +12,18 @@ from ..services.data_service import DataService
 from ..services.automation_service import AutomationService
 from ..services.account_service import AccountService
 from ..services.captcha_service import CaptchaService
-from ..translation_manager import tr, get_translation_manager, init_translation_manager
+from ..translation_manager import tr, trf, get_translation_manager, init_translation_manager
+
+# Milliseconds over which per-account status changes are coalesced into one
+# table/statistics refresh while a batch is running
+ACCOUNT_REFRESH_INTERVAL = 500
+
+# Milliseconds over which log messages are buffered and delivered as one block
+LOG_FLUSH_INTERVAL = 33
+
+# Accounts the GUI registers at a time; captchas are solved by hand, so only
+# one browser window should need attention at once
+MAX_CONCURRENT_REGISTRATIONS = 1
 
 
 class BatchCreatorViewModel(QObject):
@@ -32,18 +44,39 @@ class BatchCreatorViewModel(QObject):
     captcha_resolved = Signal(Account, str)  # account, message  
     captcha_timeout = Signal(Account, str)   # account, message
     
+    # Internal: asks the GUI thread to schedule a coalesced account refresh
+    _account_refresh_requested = Signal()
+    # Internal: asks the GUI thread to schedule delivery of buffered log messages
+    _log_flush_requested = Signal()
+    
     def __init__(self):
         super().__init__()
         
         # Services
         self.data_service = DataService()
         self.automation_service = AutomationService()
+        self.automation_service.max_concurrent = MAX_CONCURRENT_REGISTRATIONS
         self.account_service = AccountService()  # New account service
         self.captcha_service = CaptchaService()  # New captcha service for MVVM compliance
         
-        # Timer for processing simulation
-        self.processing_timer = QTimer()
-        self.processing_timer.timeout.connect(self._process_next_account_step)
+        # Account callbacks arrive from the automation loop thread; the refresh
+        # timer lives in the GUI thread and is started through a queued signal
+        self._account_refresh_timer = QTimer(self)
+        self._account_refresh_timer.setSingleShot(True)
+        self._account_refresh_timer.setInterval(ACCOUNT_REFRESH_INTERVAL)
+        self._account_refresh_timer.timeout.connect(self._flush_account_refresh)
+        self._account_refresh_requested.connect(self._schedule_account_refresh)
+        
+        # Log messages come from any thread; they are buffered and handed to the
+        # view in one block per LOG_FLUSH_INTERVAL, with one cross-thread hop
+        self._log_lock = threading.Lock()
+        self._log_buffer: List[str] = []
+        self._log_flush_pending = False
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self._log_flush_requested.connect(self._log_flush_timer.start)
         
         # Setup automation service callbacks
         self.automation_service.set_callbacks(
@@ -100,11 +133,11 @@ class BatchCreatorViewModel(QObject):
             count = self.data_service.import_from_csv(file_path)
             self.accounts_changed.emit()
             self.statistics_changed.emit()
-            self._on_log_message(tr("Successfully imported %1 accounts from CSV").replace("%1", str(count)))
+            self._on_log_message(trf("Successfully imported %1 accounts from CSV", count))
             return True
         
         except Exception as e:
-            self._on_log_message(tr("Failed to import CSV: %1").replace("%1", str(e)))
+            self._on_log_message(trf("Failed to import CSV: %1", e))
             return False
     
     def generate_random_accounts(self, count: int) -> bool:
@@ -119,7 +152,7 @@ class BatchCreatorViewModel(QObject):
         """
         try:
             if count <= 0 or count > 1000:
-                self._on_log_message(tr("Invalid account count: %1").replace("%1", str(count)))
+                self._on_log_message(trf("Invalid account count: %1", count))
                 return False
             
             # Use AccountService for better account generation
@@ -131,11 +164,11 @@ class BatchCreatorViewModel(QObject):
             # Emit signals to update UI
             self.accounts_changed.emit()
             self.statistics_changed.emit()
-            self._on_log_message(tr("Generated %1 random accounts with realistic usernames").replace("%1", str(len(generated_accounts))))
+            self._on_log_message(trf("Generated %1 random accounts with realistic usernames", len(generated_accounts)))
             return True
         
         except Exception as e:
-            self._on_log_message(tr("Failed to generate accounts: %1").replace("%1", str(e)))
+            self._on_log_message(trf("Failed to generate accounts: %1", e))
             return False
     
     def export_accounts_to_csv(self, file_path: str, include_results: bool = True) -> bool:
@@ -152,11 +185,11 @@ class BatchCreatorViewModel(QObject):
         try:
             success = self.data_service.export_to_csv(file_path, include_results)
             if success:
-                self._on_log_message(tr("Results exported to: %1").replace("%1", file_path))
+                self._on_log_message(trf("Results exported to: %1", file_path))
             return success
         
         except Exception as e:
-            self._on_log_message(tr("Failed to export results: %1").replace("%1", str(e)))
+            self._on_log_message(trf("Failed to export results: %1", e))
             return False
     
     def clear_accounts(self):
@@ -187,9 +220,10 @@ class BatchCreatorViewModel(QObject):
                 self._on_log_message(f"  - {error}")
             return False
         
-        success = self.automation_service.start_batch_registration(accounts)
+        # Accounts run on the automation service's event loop; progress comes
+        # back through the account/batch callbacks instead of a polling timer
+        success = self.automation_service.start_batch(accounts)
         if success:
-            self.processing_timer.start(1500)  # Process every 1.5 seconds
             self.processing_status_changed.emit()
             self.statistics_changed.emit()
         
@@ -204,10 +238,6 @@ class BatchCreatorViewModel(QObject):
         """
         success = self.automation_service.pause_registration()
         if success:
-            if self.automation_service.is_paused:
-                self.processing_timer.stop()
-            else:
-                self.processing_timer.start()
             self.processing_status_changed.emit()
         
         return success
@@ -222,7 +252,6 @@ class BatchCreatorViewModel(QObject):
         accounts = self.data_service.get_accounts()
         success = self.automation_service.stop_registration(accounts)
         if success:
-            self.processing_timer.stop()
             self.processing_status_changed.emit()
             self.accounts_changed.emit()
             self.statistics_changed.emit()
@@ -283,7 +312,7 @@ class BatchCreatorViewModel(QObject):
         success = translation_manager.switch_language(new_locale)
         if success:
             self.language_changed.emit(new_locale)
-            self._on_log_message(tr("Language switched to: %1").replace("%1", new_locale))
+            self._on_log_message(trf("Language switched to: %1", new_locale))
         else:
             self._on_log_message(tr("Failed to switch language"))
         
@@ -293,215 +322,58 @@ class BatchCreatorViewModel(QObject):
     def _on_account_start(self, account: Account):
         """Called when account processing starts"""
         self.account_processing_started.emit(account)
-        self.accounts_changed.emit()
+        self._account_refresh_requested.emit()
     
     def _on_account_complete(self, account: Account):
         """Called when account processing completes"""
         self.account_processing_completed.emit(account)
+        self._account_refresh_requested.emit()
+    
+    def _schedule_account_refresh(self):
+        """Start the coalescing timer unless a refresh is already pending"""
+        if not self._account_refresh_timer.isActive():
+            self._account_refresh_timer.start()
+    
+    def _flush_account_refresh(self):
+        """Refresh the table and statistics once for all changes since the last flush"""
         self.accounts_changed.emit()
         self.statistics_changed.emit()
     
     def _on_batch_complete(self, success_count: int, failed_count: int):
-        """Called when batch processing completes"""
-        self.processing_timer.stop()
-        self.processing_status_changed.emit()
-        self.batch_processing_completed.emit(success_count, failed_count)
-    
-    def _on_log_message(self, message: str):
-        """Called to log a message"""
-        self.log_message.emit(message)
-    
-    def _process_next_account_step(self):
-        """Process next account in the batch (called by timer)"""
-        accounts = self.data_service.get_accounts()
-        
-        # 增加debug日志
-        self._on_log_message(tr("DEBUG: _process_next_account_step called, accounts count: %1").replace("%1", str(len(accounts))))
-        self._on_log_message(tr("DEBUG: Current account index: %1").replace("%1", str(self.automation_service.current_account_index)))
-        self._on_log_message(tr("DEBUG: Is running: %1, Is paused: %2").replace("%1", str(self.automation_service.is_running)).replace("%2", str(self.automation_service.is_paused)))
-        
-        # Check if we should continue processing
-        if not self.automation_service.is_running or self.automation_service.is_paused:
-            self._on_log_message(tr("DEBUG: Processing stopped - running: %1, paused: %2").replace("%1", str(self.automation_service.is_running)).replace("%2", str(self.automation_service.is_paused)))
-            return
-        
-        if self.automation_service.current_account_index >= len(accounts):
-            # Batch processing complete
-            self._on_log_message(tr("DEBUG: All accounts processed, completing batch"))
-            self._complete_batch_processing(accounts)
-            return
-        
-        # IMPORTANT: Stop the timer to prevent multiple concurrent registrations
-        if self.processing_timer.isActive():
-            self._on_log_message(tr("DEBUG: Stopping processing timer to prevent concurrent registrations"))
-            self.processing_timer.stop()
-        
-        # Get current account
-        account = accounts[self.automation_service.current_account_index]
-        
-        # Skip accounts that are already successfully processed
-        if account.status == AccountStatus.SUCCESS:
-            self._on_log_message(tr("DEBUG: Account %1 already successful, skipping to next").replace("%1", account.username))
-            self.automation_service.current_account_index += 1
-            self._on_log_message(tr("DEBUG: Account index incremented to: %1").replace("%1", str(self.automation_service.current_account_index)))
-            # Schedule next processing
-            QTimer.singleShot(500, self._process_next_account_step)
-            return
-        
-        # Skip accounts that are waiting for captcha
-        if account.status == AccountStatus.CAPTCHA_PENDING:
-            self._on_log_message(tr("DEBUG: Account %1 waiting for captcha, will check later").replace("%1", account.username))
-            # Don't increment index, just schedule a check later
-            QTimer.singleShot(5000, self._process_next_account_step)
-            return
-        
-        # 增加debug日志
-        self._on_log_message(tr("DEBUG: Processing account %1: %2 (status: %3)").replace("%1", str(self.automation_service.current_account_index + 1)).replace("%2", account.username).replace("%3", account.status.value))
-        
-        # Mark account as processing
-        account.mark_processing()
-        
-        # Notify UI of account start
-        if self.automation_service.on_account_start:
-            self.automation_service.on_account_start(account)
-        
-        self._on_log_message(tr("🚀 Starting real browser registration for: %1").replace("%1", account.username))
-        
-        # Use QTimer to handle async operation in a thread-safe way
-        import threading
-        
-        def run_async_registration():
-            """Run async registration in a separate thread"""
-            import asyncio
-            
-            async def register_account():
-                try:
-                    # 增加debug日志
-                    QTimer.singleShot(0, lambda: self._on_log_message(tr("DEBUG: Calling automation_service.register_single_account for: %1").replace("%1", account.username)))
-                    success = await self.automation_service.register_single_account(account)
-                    
-                    # 增加debug日志
-                    QTimer.singleShot(0, lambda: self._on_log_message(tr("DEBUG: Registration result for %1: %2").replace("%1", account.username).replace("%2", str(success))))
-                    
-                    # Use QTimer.singleShot to safely update UI from main thread
-                    if success:
-                        QTimer.singleShot(0, lambda: self._on_log_message(tr("✅ Registration completed for: %1").replace("%1", account.username)))
-                    else:
-                        QTimer.singleShot(0, lambda: self._on_log_message(tr("❌ Registration failed for: %1").replace("%1", account.username)))
-                    
-                    # Update UI on main thread
-                    QTimer.singleShot(0, lambda: self._on_account_complete(account))
-                    
-                    # Move to next account - 确保在主线程中执行
-                    def move_to_next():
-                        self.automation_service.current_account_index += 1
-                        self._on_log_message(tr("DEBUG: Account index incremented to: %1").replace("%1", str(self.automation_service.current_account_index)))
-                        # 延迟调用resume_processing
-                        self._on_log_message(tr("DEBUG: Scheduling _resume_processing in 2 seconds"))
-                        QTimer.singleShot(2000, self._resume_processing)
-                    
-                    # 在主线程中执行账号索引递增和恢复处理
-                    QTimer.singleShot(0, move_to_next)
-                    
-                except Exception as e:
-                    # Handle errors on main thread
-                    error_msg = str(e)
-                    def handle_error():
-                        self._on_log_message(tr("DEBUG: Exception in register_account: %1").replace("%1", error_msg))
-                        account.mark_failed(error_msg)
-                        self._on_log_message(tr("❌ Registration error for %1: %2").replace("%1", account.username).replace("%2", error_msg))
-                        self._on_account_complete(account)
-                        self.automation_service.current_account_index += 1
-                        self._on_log_message(tr("DEBUG: Account index incremented after error to: %1").replace("%1", str(self.automation_service.current_account_index)))
-                        # 延迟调用resume_processing
-                        self._on_log_message(tr("DEBUG: Scheduling _resume_processing after error in 2 seconds"))
-                        QTimer.singleShot(2000, self._resume_processing)
-                    
-                    QTimer.singleShot(0, handle_error)
-            
-            # Create and run event loop in thread
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(register_account())
-                loop.close()
-            except Exception as e:
-                error_msg = str(e)
-                QTimer.singleShot(0, lambda: self._on_log_message(tr("❌ Thread error: %1").replace("%1", error_msg)))
-                QTimer.singleShot(0, lambda: account.mark_failed(error_msg))
-                QTimer.singleShot(0, lambda: self._on_account_complete(account))
-                self.automation_service.current_account_index += 1
-                
-                # IMPORTANT: Restart the timer even after thread error
-                QTimer.singleShot(2000, lambda: self._resume_processing())
-        
-        # Start async registration in a separate thread
-        registration_thread = threading.Thread(target=run_async_registration)
-        registration_thread.daemon = True  # Thread will terminate when main program exits
-        registration_thread.start()
-    
-    def _resume_processing(self):
-        """Resume processing by checking if we should continue and restart timer if needed"""
-        self._on_log_message(tr("DEBUG: _resume_processing called"))
-        self._on_log_message(tr("DEBUG: Is running: %1, Is paused: %2, Timer active: %3").replace("%1", str(self.automation_service.is_running)).replace("%2", str(self.automation_service.is_paused)).replace("%3", str(self.processing_timer.isActive())))
-        
-        if (self.automation_service.is_running and 
-            not self.automation_service.is_paused and 
-            not self.processing_timer.isActive()):
-            
-            accounts = self.data_service.get_accounts()
-            self._on_log_message(tr("DEBUG: Checking if more accounts to process. Current index: %1, Total accounts: %2").replace("%1", str(self.automation_service.current_account_index)).replace("%2", str(len(accounts))))
-            
-            # Check if there are still accounts that need processing
-            has_pending_accounts = False
-            for i in range(self.automation_service.current_account_index, len(accounts)):
-                account = accounts[i]
-                if account.status in [AccountStatus.QUEUED, AccountStatus.FAILED]:
-                    has_pending_accounts = True
-                    # Update current index to this account if it's not the current one
-                    if i != self.automation_service.current_account_index:
-                        self.automation_service.current_account_index = i
-                        self._on_log_message(tr("DEBUG: Updated account index to: %1 (account: %2)").replace("%1", str(i)).replace("%2", account.username))
-                    break
-            
-            if has_pending_accounts:
-                # Still have accounts to process, restart the timer
-                self._on_log_message(tr("DEBUG: Found pending accounts, restarting timer for next account registration"))
-                self.processing_timer.start(1500)
-            else:
-                # No more accounts that need processing
-                # Check if there are any CAPTCHA_PENDING accounts
-                waiting_captcha_count = len([acc for acc in accounts if acc.status == AccountStatus.CAPTCHA_PENDING])
-                if waiting_captcha_count > 0:
-                    self._on_log_message(tr("DEBUG: %1 accounts still waiting for captcha completion").replace("%1", str(waiting_captcha_count)))
-                    # Don't complete batch processing yet, just wait
-                    return
-                else:
-                    # No more accounts, complete batch processing
-                    self._on_log_message(tr("DEBUG: No more accounts to process, completing batch processing"))
-                    self._complete_batch_processing(accounts)
-        else:
-            self._on_log_message(tr("DEBUG: Not resuming processing - conditions not met"))
-    
-    def _complete_batch_processing(self, accounts):
-        """Complete the batch processing"""
-        self.automation_service.is_running = False
-        self.automation_service.is_paused = False
-        
-        # Calculate statistics
-        success_count = len([acc for acc in accounts if acc.status == AccountStatus.SUCCESS])
-        failed_count = len([acc for acc in accounts if acc.status == AccountStatus.FAILED])
-        
-        self._on_log_message(tr("🎉 Batch processing completed! Success: %1, Failed: %2").replace("%1", str(success_count)).replace("%2", str(failed_count)))
+        """
+        Called when batch processing completes
         
-        # Stop the processing timer
-        if self.processing_timer.isActive():
-            self.processing_timer.stop()
+        The batch ends once every account has been through the backend. Accounts
+        still waiting for a captcha are not counted; their browser windows stay
+        open and they are finished outside the batch (manual captcha check).
+        """
+        pending = sum(1 for account in self.accounts if account.status == AccountStatus.CAPTCHA_PENDING)
+        if pending:
+            self._on_log_message(trf("%1 accounts are still waiting for captcha completion in their browser windows", pending))
         
-        # Notify UI
+        # Show the final state right away instead of waiting for the timer
+        self.accounts_changed.emit()
+        self.statistics_changed.emit()
         self.processing_status_changed.emit()
         self.batch_processing_completed.emit(success_count, failed_count)
     
+    def _on_log_message(self, message: str):
+        """Called to log a message; delivered with the next buffered block"""
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self._log_flush_requested.emit()
+    
+    def _flush_log_buffer(self):
+        """Emit every message buffered since the last flush as one block"""
+        with self._log_lock:
+            messages, self._log_buffer = self._log_buffer, []
+            self._log_flush_pending = False
+        if messages:
+            self.log_message.emit("\n".join(messages))
+    
     # MVVM Captcha Service Integration Methods
     
     def manual_captcha_check(self) -> bool:
@@ -523,7 +395,7 @@ class BatchCreatorViewModel(QObject):
         # In future, could implement UI to select which account to check
         account = captcha_pending_accounts[0]
         
-        self._on_log_message(tr("🔍 Manual captcha check initiated for %1").replace("%1", account.username))
+        self._on_log_message(trf("🔍 Manual captcha check initiated for %1", account.username))
         
         # Call CaptchaService manual check if we have access to the browser page
         if hasattr(self.automation_service, 'current_page') and self.automation_service.current_page:
@@ -531,12 +403,12 @@ class BatchCreatorViewModel(QObject):
                 # Use CaptchaService manual_check method
                 success = self.captcha_service.manual_check(account, self.automation_service.current_page)
                 if success:
-                    self._on_log_message(tr("✅ Manual captcha check successful for %1").replace("%1", account.username))
+                    self._on_log_message(trf("✅ Manual captcha check successful for %1", account.username))
                 else:
-                    self._on_log_message(tr("ℹ️ Manual captcha check: captcha still pending for %1").replace("%1", account.username))
+                    self._on_log_message(trf("ℹ️ Manual captcha check: captcha still pending for %1", account.username))
                 return True
             except Exception as e:
-                self._on_log_message(tr("❌ Manual captcha check failed: %1").replace("%1", str(e)))
+                self._on_log_message(trf("❌ Manual captcha check failed: %1", e))
                 return False
         else:
             # Fallback: just log that manual check was requested
@@ -545,7 +417,7 @@ class BatchCreatorViewModel(QObject):
     
     def _on_captcha_detected(self, account: Account, message: str):
         """Handle captcha detection callback from CaptchaService"""
-        self._on_log_message(tr("⚠️ CAPTCHA DETECTED for %1: %2").replace("%1", account.username).replace("%2", message))
+        self._on_log_message(trf("⚠️ CAPTCHA DETECTED for %1: %2", account.username, message))
         
         # Update UI through signals (MVVM pattern)
         self.captcha_detected.emit(account, message)
@@ -554,36 +426,29 @@ class BatchCreatorViewModel(QObject):
     
     def _on_captcha_resolved(self, account: Account, message: str):
         """Handle captcha resolution callback from CaptchaService"""
-        self._on_log_message(tr("✅ CAPTCHA RESOLVED for %1: %2").replace("%1", account.username).replace("%2", message))
+        self._on_log_message(trf("✅ CAPTCHA RESOLVED for %1: %2", account.username, message))
         
         # Update UI through signals (MVVM pattern)
         self.captcha_resolved.emit(account, message)
         self.accounts_changed.emit()
         self.statistics_changed.emit()
-        
-        # Continue processing next account
-        QTimer.singleShot(1000, self._process_next_account_step)
     
     def _on_captcha_timeout(self, account: Account, message: str):
         """Handle captcha timeout callback from CaptchaService"""
-        self._on_log_message(tr("⏰ CAPTCHA TIMEOUT for %1: %2").replace("%1", account.username).replace("%2", message))
+        self._on_log_message(trf("⏰ CAPTCHA TIMEOUT for %1: %2", account.username, message))
         
         # Update UI through signals (MVVM pattern)
         self.captcha_timeout.emit(account, message)
         self.accounts_changed.emit()
         self.statistics_changed.emit()
-        
-        # Continue processing next account
-        QTimer.singleShot(1000, self._process_next_account_step)
     
     # Cleanup
     def cleanup(self):
         """Cleanup resources when application closes"""
-        if self.processing_timer.isActive():
-            self.processing_timer.stop()
-        
         # Cleanup captcha service monitoring
         self.captcha_service.stop_all_monitoring()
         
         if self.automation_service.is_running:
-            self.automation_service.stop_registration(self.data_service.get_accounts())
\ No newline at end of file
+            self.automation_service.stop_registration(self.data_service.get_accounts())
+        # Close the browser and stop the automation event loop
+        self.automation_service.cleanup()
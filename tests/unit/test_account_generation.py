@@ -175,6 +175,18 @@ class TestAccountGenerator:
         assert has_uppercase, "Should have uppercase letters in passwords"  
         assert has_digits, "All passwords must have digits (AC requirement)"
     
+    def test_iter_accounts_is_lazy(self):
+        """Test that iter_accounts yields username/password pairs on demand"""
+        pairs = self.generator.iter_accounts(3)
+        
+        assert not isinstance(pairs, list), "iter_accounts should not build a list"
+        
+        pairs = list(pairs)
+        assert len(pairs) == 3
+        for username, password in pairs:
+            assert 8 <= len(username) <= 16
+            assert any(c.isdigit() for c in password)
+    
     def test_csv_output_functionality(self):
         """Test CSV save functionality"""
         accounts = self.generator.generate_unique_accounts(5)
@@ -265,6 +265,166 @@ class TestAutomationServiceRegistration:
         assert account.status == AccountStatus.FAILED
         assert error_msg in account.notes
     
+    def test_batch_statistics_counted_incrementally(self):
+        """Test that batch completion reports counters updated as accounts finish"""
+        accounts = [
+            Account(id=1, username="done_user", password="test123", status=AccountStatus.SUCCESS),
+            Account(id=2, username="next_user", password="test123"),
+            Account(id=3, username="fail_user", password="test123"),
+        ]
+        
+        async def fake_register(account):
+            if account.username == "fail_user":
+                account.mark_failed("failed")
+                return False
+            account.mark_success("ok")
+            return True
+        
+        self.service._backend.register_account = AsyncMock(side_effect=fake_register)
+        mock_batch_complete = MagicMock()
+        self.service.set_callbacks(on_batch_complete=mock_batch_complete)
+        
+        assert self.service.start_batch_registration(accounts) is True
+        assert self.service.current_account_index == 1
+        
+        while self.service.process_next_account(accounts):
+            self.service.complete_current_account(accounts)
+        
+        mock_batch_complete.assert_called_once_with(2, 1)
+
+    def test_backend_coroutines_share_one_event_loop(self):
+        """Test that registration and stop cleanup run on the service's loop thread"""
+        import threading
+        loops = []
+
+        async def record_loop(*args):
+            loops.append((asyncio.get_running_loop(), threading.current_thread()))
+            return True
+
+        self.service._backend.register_account = AsyncMock(side_effect=record_loop)
+        self.service._backend.cleanup_async = AsyncMock(side_effect=record_loop)
+        accounts = [Account(id=1, username="loop_user", password="test123")]
+
+        self.service.start_batch_registration(accounts)
+        self.service.process_next_account(accounts)
+        asyncio.run(self.service.register_single_account(accounts[0]))
+        self.service.cleanup()
+
+        assert len(loops) == 3
+        assert len(set(loops)) == 1
+        assert loops[0][1] is not threading.current_thread()
+
+    def test_set_backend_waits_for_old_backend_cleanup(self):
+        """Test that switching backends finishes cleanup on the loop thread first"""
+        import threading
+        old_backend = self.service._backend
+        cleanup_threads = []
+
+        async def record_cleanup():
+            cleanup_threads.append(threading.current_thread())
+
+        old_backend.cleanup_async = AsyncMock(side_effect=record_cleanup)
+
+        self.service.set_backend("selenium")
+
+        assert len(cleanup_threads) == 1
+        assert cleanup_threads[0] is not threading.current_thread()
+        assert self.service._backend is not old_backend
+        self.service.cleanup()
+
+    def test_run_batch_bounded_concurrency(self):
+        """Test that run_batch overlaps registrations up to max_concurrent"""
+        running = 0
+        peak = 0
+
+        async def slow_register(account):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            account.mark_success("ok")
+            return True
+
+        self.service._backend.register_account = AsyncMock(side_effect=slow_register)
+        self.service.max_concurrent = 2
+        mock_account_complete = MagicMock()
+        mock_batch_complete = MagicMock()
+        self.service.set_callbacks(on_account_complete=mock_account_complete,
+                                   on_batch_complete=mock_batch_complete)
+        accounts = [Account(id=i, username=f"batch_user{i}", password="test123") for i in range(5)]
+
+        assert asyncio.run(self.service.run_batch(accounts)) is True
+
+        assert peak == 2
+        assert mock_account_complete.call_count == 5
+        mock_batch_complete.assert_called_once_with(5, 0)
+        assert self.service.is_running is False
+        self.service.cleanup()
+
+    def test_run_batch_counts_already_processed_accounts(self):
+        """Test that accounts skipped as already processed still count toward totals and progress"""
+        async def succeed(account):
+            account.mark_success("ok")
+            return True
+
+        self.service._backend.register_account = AsyncMock(side_effect=succeed)
+        mock_batch_complete = MagicMock()
+        self.service.set_callbacks(on_batch_complete=mock_batch_complete)
+        accounts = [
+            Account(id=1, username="first_user", password="test123"),
+            Account(id=2, username="done_user", password="test123", status=AccountStatus.SUCCESS),
+            Account(id=3, username="last_user", password="test123"),
+        ]
+
+        assert asyncio.run(self.service.run_batch(accounts)) is True
+
+        assert self.service._backend.register_account.await_count == 2
+        mock_batch_complete.assert_called_once_with(3, 0)
+        assert self.service.current_account_index == 3
+        assert self.service.get_progress_info(accounts)['progress_percent'] == 100
+        self.service.cleanup()
+
+    def test_stop_then_restart_does_not_mix_batches(self):
+        """Test that a stopped batch's workers neither re-register accounts nor finish the new batch"""
+        import threading
+        aborted = asyncio.Event()
+        first_started = threading.Event()
+        batch_done = threading.Event()
+        calls = []
+
+        async def register(account):
+            calls.append(account.username)
+            if len(calls) == 1:
+                # First registration hangs until stop aborts it through the backend reset
+                first_started.set()
+                await aborted.wait()
+                account.mark_failed("aborted")
+                return False
+            account.mark_success("ok")
+            return True
+
+        async def reset():
+            aborted.set()
+
+        self.service._backend.register_account = AsyncMock(side_effect=register)
+        self.service._backend.reset_async = AsyncMock(side_effect=reset)
+        self.service.max_concurrent = 1
+        mock_batch_complete = MagicMock(side_effect=lambda *args: batch_done.set())
+        self.service.set_callbacks(on_batch_complete=mock_batch_complete)
+        accounts = [Account(id=i, username=f"restart_user{i}", password="test123") for i in range(3)]
+
+        assert self.service.start_batch(accounts) is True
+        assert first_started.wait(5)
+        assert self.service.stop_registration(accounts) is True
+        assert self.service.start_batch(accounts) is True
+        assert batch_done.wait(5)
+
+        mock_batch_complete.assert_called_once_with(3, 0)
+        assert calls == ["restart_user0", "restart_user0", "restart_user1", "restart_user2"]
+        assert all(account.status == AccountStatus.SUCCESS for account in accounts)
+        self.service.cleanup()
+
     def test_callback_system_integration(self):
         """Test callback system works correctly"""
         # Setup callbacks
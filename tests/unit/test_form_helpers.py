@@ -0,0 +1,112 @@
+"""
+Unit tests for form helper selector utilities
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.services.automation.form_helpers import SelectorCache, fill_form, join_selectors
+
+
+SELECTORS = ('xpath=//form/input', 'input[name="username"]', '#username')
+
+
+def make_page(locator):
+    """Build a page mock whose locator chain always resolves to the given locator"""
+    page = MagicMock()
+    page.locator.return_value = locator
+    locator.or_.return_value = locator
+    locator.locator.return_value = locator
+    locator.first = locator
+    return page
+
+
+class TestFormHelpers:
+    """Test suite for selector unions and the selector cache"""
+
+    def test_join_selectors_splits_engine_selectors(self):
+        """Test that CSS entries are comma-joined and engine selectors kept apart"""
+        css, others = join_selectors(SELECTORS)
+        assert css == 'input[name="username"], #username'
+        assert others == ('xpath=//form/input',)
+
+    def test_selector_cache_learns_winner(self):
+        """Test that the matching selector is used alone on the next lookup"""
+        locator = MagicMock()
+        locator.wait_for = AsyncMock()
+        page = make_page(locator)
+        page.evaluate = AsyncMock(return_value=[False, False, True])
+        cache = SelectorCache()
+
+        asyncio.run(cache.locate(page, SELECTORS, 1000))
+        page.locator.reset_mock()
+        asyncio.run(cache.locate(page, SELECTORS, 1000))
+
+        page.locator.assert_called_once_with('#username')
+
+    def test_selector_cache_forgets_stale_winner(self):
+        """Test that a winner that stops matching falls back to the full union"""
+        locator = MagicMock()
+        locator.wait_for = AsyncMock(side_effect=[None, PlaywrightTimeoutError("gone"), None])
+        page = make_page(locator)
+        page.evaluate = AsyncMock(side_effect=[[False, False, True], [False, True, True]])
+        cache = SelectorCache()
+
+        asyncio.run(cache.locate(page, SELECTORS, 1000))
+        asyncio.run(cache.locate(page, SELECTORS, 1000))
+
+        assert locator.wait_for.await_args_list[-1].kwargs['timeout'] == SelectorCache.RELEARN_TIMEOUT
+        assert cache._winners[SELECTORS] == 'input[name="username"]'
+
+    def test_selector_cache_prefers_list_order_over_dom_order(self):
+        """Test that an earlier entry wins even when a broader fallback matches earlier in the page"""
+        locator = MagicMock()
+        locator.wait_for = AsyncMock()
+        locator.count = AsyncMock(return_value=0)
+        page = make_page(locator)
+        # The union's DOM-order first match is '#username' (a login form higher up);
+        # the xpath entry is not visible and 'input[name="username"]' is
+        page.evaluate = AsyncMock(return_value=[False, True, True])
+        cache = SelectorCache()
+
+        asyncio.run(cache.locate(page, SELECTORS, 1000))
+
+        assert cache._winners[SELECTORS] == 'input[name="username"]'
+        assert page.locator.call_args_list[-1].args == ('input[name="username"]',)
+
+    def test_selector_cache_asks_playwright_about_engine_selectors(self):
+        """Test that entries the page script cannot evaluate are checked through Playwright in order"""
+        selectors = ('text="注册"', '.register-btn')
+        locator = MagicMock()
+        locator.wait_for = AsyncMock()
+        locator.count = AsyncMock(return_value=1)
+        page = make_page(locator)
+        page.evaluate = AsyncMock(return_value=[None, True])
+        cache = SelectorCache()
+
+        asyncio.run(cache.locate(page, selectors, 1000))
+
+        assert cache._winners[selectors] == 'text="注册"'
+
+    def test_fill_form_uses_one_evaluation(self):
+        """Test that all fields and the checkbox are sent in a single evaluate call"""
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value={'values': ['alice', None], 'checked': True})
+
+        values, checked = asyncio.run(fill_form(
+            page, [(SELECTORS, 'alice'), (('#password',), 'secret')], ('text=同意', 'input[type="checkbox"]')
+        ))
+
+        assert values == ['alice', None]
+        assert checked is True
+        page.evaluate.assert_awaited_once()
+        fields, checkboxes = page.evaluate.await_args.args[1]
+        assert fields[0] == [['input[name="username"]', '#username'], 'alice']
+        assert checkboxes == ['input[type="checkbox"]']
@@ -0,0 +1,32 @@
+"""
+Unit tests for registration result indicator scanning
+"""
+
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.automation.result_detector import _occurrence_pattern, _prefix_indicators, find_indicators
+
+
+class TestIndicatorScanning:
+    """Test suite for the one-pass indicator scan"""
+
+    def test_pattern_reports_only_longest_indicator_per_offset(self):
+        """Test that the lookahead pattern alone loses a prefix indicator at the same offset"""
+        pattern = _occurrence_pattern(["已注册", "已注册成功", "注册"])
+
+        assert set(pattern.findall("账号已注册成功")) == {"已注册成功", "注册"}
+
+    def test_find_indicators_recovers_prefix_indicators(self):
+        """Test that prefix indicators are still reported through the substring fallback"""
+        indicators = ["已注册", "已注册成功", "注册"]
+        pattern = _occurrence_pattern(indicators)
+        prefixes = _prefix_indicators(indicators)
+
+        assert prefixes == ("已注册",)
+        assert find_indicators(pattern, prefixes, "账号已注册成功") == {"已注册", "已注册成功", "注册"}
+        assert find_indicators(pattern, prefixes, "无结果") == set()
@@ -0,0 +1,212 @@
+"""
+Unit tests for the Selenium backend browser pool
+"""
+
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.account import Account
+from src.services.automation import selenium_backend
+from src.services.automation.selenium_backend import SeleniumBackend
+
+
+def make_driver(*args, **kwargs):
+    """Build a driver mock sitting on its home tab"""
+    driver = MagicMock()
+    driver.current_window_handle = 'home'
+    driver.window_handles = ['home']
+    return driver
+
+
+class TestSeleniumBackendPool:
+    """Test suite for browser reuse across accounts"""
+
+    def setup_method(self):
+        """Setup test backend"""
+        self.backend = SeleniumBackend()
+
+    def test_released_browser_is_reused(self):
+        """Test that the next account gets the same browser with cookies cleared"""
+        with patch.object(selenium_backend.uc, 'Chrome', side_effect=make_driver) as chrome:
+            first = self.backend._acquire_session()
+            self.backend._release_session(first)
+            second = self.backend._acquire_session()
+
+        assert second is first
+        chrome.assert_called_once()
+        first.driver.execute_cdp_cmd.assert_any_call('Network.clearBrowserCookies', {})
+
+    def test_concurrent_accounts_get_separate_browsers(self):
+        """Test that a busy browser is never handed to a second account"""
+        with patch.object(selenium_backend.uc, 'Chrome', side_effect=make_driver) as chrome:
+            first = self.backend._acquire_session()
+            second = self.backend._acquire_session()
+
+        assert first.driver is not second.driver
+        assert chrome.call_count == 2
+
+    def test_browser_replaced_after_max_uses(self):
+        """Test that a browser is quit instead of pooled once it reaches its use limit"""
+        with patch.object(selenium_backend, 'SESSION_MAX_USES', 2), \
+             patch.object(selenium_backend.uc, 'Chrome', side_effect=make_driver) as chrome:
+            first = self.backend._acquire_session()
+            self.backend._release_session(first)
+            assert self.backend._acquire_session() is first
+            self.backend._release_session(first)
+            second = self.backend._acquire_session()
+
+        first.driver.quit.assert_called_once()
+        assert second is not first
+        assert chrome.call_count == 2
+
+    def test_cleanup_quits_all_browsers(self):
+        """Test that cleanup quits idle and in-use browsers"""
+        with patch.object(selenium_backend.uc, 'Chrome', side_effect=make_driver):
+            idle = self.backend._acquire_session()
+            busy = self.backend._acquire_session()
+            self.backend._release_session(idle)
+
+        self.backend.cleanup()
+
+        idle.driver.quit.assert_called_once()
+        busy.driver.quit.assert_called_once()
+        assert not self.backend._idle_sessions and not self.backend._active_sessions
+
+
+class TestSeleniumBackendPolling:
+    """Test suite for locator wait polling"""
+
+    def setup_method(self):
+        """Setup test backend"""
+        self.backend = SeleniumBackend()
+
+    def test_wait_backs_off_after_fast_period(self):
+        """Test that polling starts fast and doubles up to the cap on long waits"""
+        clock = [0.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        driver = MagicMock()
+        driver.execute_script.return_value = None
+        with patch.object(selenium_backend.time, 'monotonic', side_effect=lambda: clock[0]), \
+             patch.object(selenium_backend.time, 'sleep', side_effect=fake_sleep):
+            result = self.backend._wait_for_displayed(driver, (('css selector', '#x'),), 12)
+
+        assert result is None
+        fast = [s for s in sleeps if s == selenium_backend.FAST_POLL_INTERVAL]
+        assert len(fast) == selenium_backend.FAST_POLL_PERIOD / selenium_backend.FAST_POLL_INTERVAL
+        assert max(sleeps) == selenium_backend.MAX_POLL_INTERVAL
+        assert len(sleeps) < 12 / selenium_backend.FAST_POLL_INTERVAL
+
+    def test_wait_returns_element_and_remembers_locator(self):
+        """Test that a match is returned and its locator probed first next time"""
+        selectors = (('css selector', '#a'), ('css selector', '#b'))
+        element = MagicMock()
+        driver = MagicMock()
+        driver.execute_script.return_value = [1, element]
+
+        assert self.backend._wait_for_displayed(driver, selectors, 5) is element
+        assert self.backend._selector_hits[selectors] == selectors[1]
+
+
+class TestSeleniumBackendFormFill:
+    """Test suite for the single-script form fill"""
+
+    def setup_method(self):
+        """Setup test backend and account"""
+        self.backend = SeleniumBackend()
+        self.account = Account(id=1, username="fill_user", password="Passw0rd!")
+
+    def test_fill_form_uses_one_script_call(self):
+        """Test that all fields and the checkbox are handled by one execute_script"""
+        driver = MagicMock()
+        driver.execute_script.return_value = {
+            'values': ["fill_user", "Passw0rd!", "Passw0rd!"], 'checked': True
+        }
+
+        assert self.backend._fill_form(driver, self.account, MagicMock()) is True
+        driver.execute_script.assert_called_once()
+        fields, checkboxes = driver.execute_script.call_args[0][1]
+        assert fields[0][0][0] == '.quc-mod-sign-up form input[name="username"]'
+        assert [value for _, value in fields] == ["fill_user", "Passw0rd!", "Passw0rd!"]
+        assert checkboxes
+
+    def test_fill_form_reports_mismatch(self):
+        """Test that a field that did not take its value sends the caller to the fallback"""
+        driver = MagicMock()
+        driver.execute_script.return_value = {'values': ["fill_user", None, "Passw0rd!"], 'checked': True}
+
+        assert self.backend._fill_form(driver, self.account, MagicMock()) is False
+
+
+class TestSeleniumBackendNavigation:
+    """Test suite for navigation retries"""
+
+    def setup_method(self):
+        """Setup test backend"""
+        self.backend = SeleniumBackend()
+
+    def test_retry_backoff_depends_on_error(self):
+        """Test that timeouts retry quickly and connection errors back off longer"""
+        driver = MagicMock()
+        driver.get.side_effect = [selenium_backend.TimeoutException("slow"), ConnectionError("reset"), None]
+
+        with patch.object(selenium_backend.time, 'sleep') as sleep:
+            self.backend._navigate_with_retry(driver, 'https://example.com/', max_retries=3)
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert delays == [
+            selenium_backend.NAVIGATION_RETRY_DELAYS[0] * 0.3,
+            selenium_backend.NAVIGATION_RETRY_DELAYS[1] * 2.0,
+        ]
+        assert driver.get.call_count == 3
+
+
+class TestSeleniumBackendVerification:
+    """Test suite for registration result verification"""
+
+    def setup_method(self):
+        """Setup test backend and account"""
+        self.backend = SeleniumBackend()
+        self.account = Account(id=1, username="verify_user", password="Passw0rd!")
+
+    def _driver(self, texts):
+        """Driver whose page never shows the logout link but shows the given texts"""
+        driver = MagicMock()
+        driver.execute_script.side_effect = (
+            lambda script, arg: texts if script == selenium_backend._PRESENT_TEXTS_JS else None
+        )
+        return driver
+
+    def test_new_failure_message_ends_wait_early(self):
+        """Test that a failure message appearing after submit fails without waiting for the timeout"""
+        driver = self._driver(["用户名已存在"])
+
+        with patch.object(selenium_backend.time, 'sleep') as sleep:
+            assert self.backend._verify_registration_success(driver, self.account) is False
+
+        sleep.assert_not_called()
+        assert "用户名已存在" in self.account.notes
+
+    def test_message_shown_before_submit_is_ignored(self):
+        """Test that failure text already on the page before submitting does not end the wait"""
+        clock = [0.0]
+        driver = self._driver(["已注册"])
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch.object(selenium_backend.time, 'monotonic', side_effect=lambda: clock[0]), \
+             patch.object(selenium_backend.time, 'sleep', side_effect=fake_sleep):
+            assert self.backend._verify_registration_success(driver, self.account, ["已注册"]) is False
+
+        assert clock[0] >= 30
+        assert "logout link did not appear" in self.account.notes
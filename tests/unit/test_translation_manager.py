@@ -12,7 +12,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from PySide6.QtWidgets import QApplication
-from src.translation_manager import TranslationManager, tr
+from src.translation_manager import TranslationManager, tr, trf, clear_translation_cache, _translate
 
 
 def test_translation_core():
@@ -69,5 +69,33 @@ def test_translation_core():
     return 0
 
 
+def test_translation_cache():
+    """Test that repeated lookups are memoized and the cache can be cleared"""
+    clear_translation_cache()
+    
+    first = tr('Success')
+    second = tr('Success')
+    assert first == second
+    assert _translate.cache_info().hits >= 1
+    
+    clear_translation_cache()
+    assert _translate.cache_info().currsize == 0
+
+
+def test_trf_fills_placeholders():
+    """Test that trf matches the tr().replace() chain it replaces"""
+    template = "FAILED: %1 - %2 {raw}"
+    
+    expected = tr(template).replace("%1", "alice").replace("%2", "42")
+    assert trf(template, "alice", 42) == expected
+    assert trf("Navigation attempt %1/%2", 1, 3) == "Navigation attempt 1/3"
+
+
+def test_trf_leaves_placeholders_without_arguments():
+    """Test that a template with more placeholders than arguments keeps the extras, like replace()"""
+    assert trf("FAILED: %1 - %2", "alice") == "FAILED: alice - %2"
+    assert trf("Done %1%") == "Done %1%"
+
+
 if __name__ == "__main__":
     sys.exit(test_translation_core())
\ No newline at end of file